@@ -0,0 +1 @@
+# Makes the repository root importable (models, views, utils) when running plain `pytest`
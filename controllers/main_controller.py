@@ -1,36 +1,63 @@
 from PyQt6.QtWidgets import QMainWindow, QApplication
 from models.event_model import EventRepository
+from models.event_store import EventStore
 from views.calendar_view import CalendarView
 from views.events_view import EventsView
-from views.map_view import MapView
+from utils import startup_report
+from utils.settings import get_setting
 
 class MainController:
     def __init__(self):
         self.event_repo = EventRepository()
-        self.events = self.event_repo.load_events()
-        self.cal_win = CalendarView(self.events)
-        self.ev_win = EventsView(self.events, self.event_repo)
-        self.map_win = MapView(self.events)
-        self.ev_win.event_edited.connect(self.on_events_changed)
+        self.event_store = EventStore(self.event_repo)
+        self.events = self.event_store.events
+        # Each window subscribes to the store's added/updated/removed signals itself
+        self.cal_win = CalendarView(self.event_store)
+        self.ev_win = EventsView(self.event_store)
+        # The map window pulls in matplotlib and numpy, so it is built after the calendar is up
+        self.map_win = None
+        self.pending_selection = None
 
         # self.map_win.day_clicked.connect(self.cal_win.on_day_cell_clicked)
-        self.cal_win.day_clicked.connect(self.map_win.highlight_date)
+        self.cal_win.day_clicked.connect(self.on_day_clicked)
+
+    def on_day_clicked(self, events):
+        if self.map_win is None:
+            self.pending_selection = events
+            return
+        self.map_win.highlight_date(events)
 
     def show_all_windows(self):
         self.cal_win.setWindowTitle('Calendar')
         self.cal_win.show()
         # Now position map & events relative to calendar
         cal_geom = self.cal_win.geometry()
-        # Map: right of calendar +5px
-        self.map_win.setWindowTitle('Map')
-        self.map_win.move(cal_geom.x() + cal_geom.width() + 5, cal_geom.y())
-        self.map_win.show()
         # Events: left of calendar - width - 5px
         self.ev_win.setWindowTitle('Events')
         self.ev_win.move(cal_geom.x() - self.ev_win.width() - 5, cal_geom.y())
         self.ev_win.show()
+        # The map stack is imported only once the calendar's first frame is on screen
+        self.cal_win.first_painted.connect(self.on_calendar_painted)
+
+    def on_calendar_painted(self):
+        startup_report.mark("calendar painted")
+        self.show_map_window()
 
-    def on_events_changed(self):
-        self.events = self.event_repo.load_events()
-        self.cal_win.events = self.events
-        self.cal_win.refresh()
+    def show_map_window(self):
+        if self.map_win is None:
+            # "graphics" selects the QGraphicsScene backend, which doesn't need matplotlib at all
+            if get_setting("map/backend", "matplotlib") == "graphics":
+                from views.graphics_map_view import GraphicsMapView as MapView
+            else:
+                from views.map_view import MapView
+            self.map_win = MapView(self.event_store)
+            self.map_win.map_ready.connect(lambda: startup_report.mark("map first frame"))
+            startup_report.mark("map window built")
+            if self.pending_selection is not None:
+                self.map_win.highlight_date(self.pending_selection)
+                self.pending_selection = None
+        cal_geom = self.cal_win.geometry()
+        # Map: right of calendar +5px
+        self.map_win.setWindowTitle('Map')
+        self.map_win.move(cal_geom.x() + cal_geom.width() + 5, cal_geom.y())
+        self.map_win.show()
@@ -1,10 +1,17 @@
 import sys
+from utils import startup_report
 from PyQt6.QtWidgets import QApplication
 from controllers.main_controller import MainController
 
 def main():
+    if "--startup-report" in sys.argv:
+        sys.argv.remove("--startup-report")
+        startup_report.enable()
+    startup_report.mark("imports")
     app = QApplication(sys.argv)
+    startup_report.mark("QApplication")
     controller = MainController()
+    startup_report.mark("controller")
     controller.cal_win.closeEvent = lambda event: (app.quit(), event.accept())
     controller.show_all_windows()
     sys.exit(app.exec())
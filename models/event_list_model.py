@@ -0,0 +1,104 @@
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, QSortFilterProxyModel, Qt
+from PyQt6.QtGui import QColor
+
+EventIdRole = Qt.ItemDataRole.UserRole
+SortKeyRole = Qt.ItemDataRole.UserRole + 1
+
+
+class EventListModel(QAbstractListModel):
+    """One row per event in the store, kept in step through the store's change signals.
+
+    Rows are only materialized when a view asks for them, so a QListView shows
+    thousands of events while touching just the visible rows.
+    """
+
+    def __init__(self, event_store, parent=None):
+        super().__init__(parent)
+        self.event_store = event_store
+        self._ids = [e.id for e in event_store.events]
+        self._rows = {event_id: row for row, event_id in enumerate(self._ids)}
+        self._search_text = {}  # id -> lowercase description
+        event_store.events_added.connect(self.on_events_added)
+        event_store.events_updated.connect(self.on_events_updated)
+        event_store.events_removed.connect(self.on_events_removed)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._ids)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        ev = self.event_store.get(self._ids[index.row()])
+        if role == Qt.ItemDataRole.DisplayRole:
+            return ev.description
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return QColor(*ev.chip)
+        if role == EventIdRole:
+            return ev.id
+        if role == SortKeyRole:
+            return self.search_text(index.row())
+        return None
+
+    def event_id(self, row):
+        return self._ids[row]
+
+    def search_text(self, row):
+        event_id = self._ids[row]
+        text = self._search_text.get(event_id)
+        if text is None:
+            text = self._search_text[event_id] = self.event_store.get(event_id).description.lower()
+        return text
+
+    def on_events_added(self, ids):
+        first = len(self._ids)
+        self.beginInsertRows(QModelIndex(), first, first + len(ids) - 1)
+        for event_id in ids:
+            self._rows[event_id] = len(self._ids)
+            self._ids.append(event_id)
+        self.endInsertRows()
+
+    def on_events_updated(self, ids, previous=()):
+        for event_id in ids:
+            self._search_text.pop(event_id, None)
+            row = self._rows.get(event_id)
+            if row is not None:
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+
+    def on_events_removed(self, ids, previous=()):
+        for event_id in ids:
+            row = self._rows.get(event_id)
+            if row is None:
+                continue
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._ids[row]
+            self._search_text.pop(event_id, None)
+            self.endRemoveRows()
+            self._rows = {eid: r for r, eid in enumerate(self._ids)}
+
+
+class EventFilterProxyModel(QSortFilterProxyModel):
+    """Shows the rows of a search result, ordered by rank.
+
+    Without an active query every row is shown, sorted by description.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._ranks = None  # id -> rank of the current search result
+        self.setSortRole(SortKeyRole)
+        self.setDynamicSortFilter(True)
+
+    def set_matches(self, ids):
+        """Restrict to ``ids`` (best first), or show everything when ``ids`` is None."""
+        self._ranks = None if ids is None else {event_id: rank for rank, event_id in enumerate(ids)}
+        self.invalidate()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self._ranks is None or self.sourceModel().event_id(source_row) in self._ranks
+
+    def lessThan(self, left, right):
+        if self._ranks is None:
+            return super().lessThan(left, right)
+        model = self.sourceModel()
+        return self._ranks[model.event_id(left.row())] < self._ranks[model.event_id(right.row())]
@@ -1,16 +1,33 @@
+import bisect
 import json
+import os
+import tempfile
+import uuid
 from datetime import datetime
 
+from utils.date_utils import parse_event_date, format_event_date
+
 class Event:
-    def __init__(self, description, county, city, independent, visited, start_date, end_date, chip):
+    __slots__ = ('id', 'description', 'county', 'city', 'independent', 'visited',
+                 'start_date', 'end_date', 'start_ordinal', 'end_ordinal', 'chip')
+
+    def __init__(self, description, county, city, independent, visited, start_date, end_date, chip, id=None):
+        # Stable identity used by the change log; edits keep the id of the event they replace
+        self.id = id or uuid.uuid4().hex
         self.description = description
         self.county = county
         self.city = city
         self.independent = independent
         self.visited = visited
-        self.start_date = start_date
-        self.end_date = end_date
-        self.chip = chip
+        # Dates are parsed once here; views compare the date objects or their ordinals
+        self.start_date = parse_event_date(start_date)
+        self.end_date = parse_event_date(end_date)
+        self.start_ordinal = self.start_date.toordinal()
+        self.end_ordinal = self.end_date.toordinal()
+        self.chip = tuple(chip)  # (r, g, b)
+
+    def date_range_text(self):
+        return f"{format_event_date(self.start_date)} – {format_event_date(self.end_date)}"
 
     @staticmethod
     def from_dict(d):
@@ -22,29 +39,184 @@ class Event:
             visited=d['visited'],
             start_date=d['start_date'],
             end_date=d['end_date'],
-            chip=d['chip']
+            chip=d['chip'],
+            id=d.get('id')
         )
 
     def to_dict(self):
         return {
+            'id': self.id,
             'description': self.description,
             'county': self.county,
             'city': self.city,
             'independent': self.independent,
             'visited': self.visited,
-            'start_date': self.start_date,
-            'end_date': self.end_date,
-            'chip': self.chip
+            'start_date': format_event_date(self.start_date),
+            'end_date': format_event_date(self.end_date),
+            'chip': list(self.chip)
         }
 
 class EventRepository:
-    def __init__(self, path='data/events.json'):
+    """events.json snapshot plus an append-only change log next to it.
+
+    Each add/update/delete appends one JSON line to the log, so a save costs
+    O(change). The log is folded back into the snapshot (written atomically via
+    temp file + rename) on load and every ``compact_every`` records. A torn
+    last line left by a crash is ignored on replay.
+    """
+
+    def __init__(self, path='data/events.json', log_path=None, compact_every=200):
         self.path = path
+        self.log_path = log_path or os.path.splitext(path)[0] + '.log'
+        self.compact_every = compact_every
+        # id -> Event in snapshot order; kept current by record_* and rebuilt in place, never rebound
+        self.events_by_id = {}
+        self._log_records = 0
+        self._loaded = False
+
+    def get(self, event_id):
+        return self.events_by_id.get(event_id)
 
     def load_events(self):
         with open(self.path, 'r', encoding='utf-8') as f:
-            return [Event.from_dict(x) for x in json.load(f)]
+            raw = json.load(f)
+        self.events_by_id.clear()
+        for x in raw:
+            ev = Event.from_dict(x)
+            self.events_by_id[ev.id] = ev
+        needs_ids = any('id' not in x for x in raw)
+        had_log = self._replay_log()
+        self._loaded = True
+        if needs_ids or had_log:
+            self.compact()
+        return list(self.events_by_id.values())
+
+    def load_table(self):
+        """Columnar view of the events, reading the file only if nothing is loaded yet.
+
+        Once loaded, ``events_by_id`` is shared with the live EventStore, so it must
+        not be reloaded (that would swap in new Event objects behind its indexes).
+        """
+        # numpy is only pulled in for callers that want the columnar view
+        from models.event_table import EventTable
+        if not self._loaded:
+            self.load_events()
+        return EventTable(self.events_by_id.values())
+
+    def _replay_log(self):
+        try:
+            f = open(self.log_path, 'r', encoding='utf-8')
+        except FileNotFoundError:
+            return False
+        with f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break  # torn write at the tail
+                if record['op'] == 'delete':
+                    self.events_by_id.pop(record['id'], None)
+                else:
+                    self.events_by_id[record['id']] = Event.from_dict(record['event'])
+        return True
+
+    def record_added(self, ev):
+        self.events_by_id[ev.id] = ev
+        self._append({'op': 'add', 'id': ev.id, 'event': ev.to_dict()})
+
+    def record_updated(self, ev):
+        self.events_by_id[ev.id] = ev
+        self._append({'op': 'update', 'id': ev.id, 'event': ev.to_dict()})
+
+    def record_deleted(self, ev):
+        self.events_by_id.pop(ev.id, None)
+        self._append({'op': 'delete', 'id': ev.id})
+
+    def _append(self, record):
+        with open(self.log_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        self._log_records += 1
+        if self._log_records >= self.compact_every:
+            self.compact()
+
+    def compact(self):
+        """Write the current state as a fresh snapshot and drop the change log."""
+        self.save_events(list(self.events_by_id.values()))
 
     def save_events(self, events):
-        with open(self.path, 'w', encoding='utf-8') as f:
-            json.dump([e.to_dict() for e in events], f, indent=2)
+        by_id = {e.id: e for e in events}
+        self.events_by_id.clear()
+        self.events_by_id.update(by_id)
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.events-', suffix='.json.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump([e.to_dict() for e in events], f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        # Replaying the log over the new snapshot is idempotent, so a crash here loses nothing
+        if os.path.exists(self.log_path):
+            os.remove(self.log_path)
+        self._log_records = 0
+
+
+class EventIndex:
+    """Date-interval index over events for "events on day" / "events in range" queries.
+
+    Events are kept sorted by start date. A query only has to look back as far
+    as the longest event, so it touches the events near the requested dates
+    instead of scanning the whole list.
+    """
+
+    def __init__(self, events=()):
+        self._entries = []  # sorted (start ordinal, end ordinal, seq, event)
+        self._max_span = 0
+        self._seq = 0
+        for ev in events:
+            self.add(ev)
+
+    def add(self, ev):
+        start, end = ev.start_ordinal, ev.end_ordinal
+        self._seq += 1
+        bisect.insort(self._entries, (start, end, self._seq, ev), key=lambda entry: entry[:3])
+        self._max_span = max(self._max_span, end - start)
+
+    def remove(self, ev):
+        start = ev.start_ordinal
+        lo = bisect.bisect_left(self._entries, start, key=lambda entry: entry[0])
+        for i in range(lo, len(self._entries)):
+            if self._entries[i][0] != start:
+                break
+            if self._entries[i][3] is ev:
+                del self._entries[i]
+                return
+        raise ValueError("event is not in the index")
+
+    def replace(self, old, new):
+        self.remove(old)
+        self.add(new)
+
+    def events_between(self, start, end):
+        """Events overlapping [start, end] (dates or datetimes), ordered by start then description."""
+        lo_ord, hi_ord = _ordinal(start), _ordinal(end)
+        lo = bisect.bisect_left(self._entries, lo_ord - self._max_span, key=lambda entry: entry[0])
+        hi = bisect.bisect_right(self._entries, hi_ord, key=lambda entry: entry[0])
+        result = [entry for entry in self._entries[lo:hi] if entry[1] >= lo_ord]
+        result.sort(key=lambda entry: (entry[0], entry[3].description))
+        return [entry[3] for entry in result]
+
+    def events_on(self, day):
+        return self.events_between(day, day)
+
+
+def _ordinal(day):
+    if isinstance(day, datetime):
+        day = day.date()
+    return day.toordinal()
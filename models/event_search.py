@@ -0,0 +1,262 @@
+import bisect
+import re
+import shlex
+from datetime import date
+
+from utils.date_utils import parse_event_date
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:\.[a-z0-9]+)*")
+FIELDS = ("description", "city", "county")
+# Score for a free-text term matching a whole token in each field; substring hits score 1
+FIELD_WEIGHTS = {"description": 2, "city": 3, "county": 3}
+FIELD_ALIASES = {"desc": "description", "description": "description", "city": "city", "county": "county"}
+MONTH_NAMES = {name: i for i, name in enumerate(
+    ["january", "february", "march", "april", "may", "june", "july",
+     "august", "september", "october", "november", "december"], start=1)}
+# month: also takes abbreviations; bare abbreviations stay free text ("mar" is Marion, "aug" Auglaize)
+MONTHS = dict(MONTH_NAMES, **{name[:3]: i for name, i in MONTH_NAMES.items()})
+TRUE_WORDS = {"yes", "y", "true", "1"}
+FALSE_WORDS = {"no", "n", "false", "0"}
+
+
+def tokenize(text):
+    return _TOKEN.findall(text.lower())
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _bits(bitset):
+    while bitset:
+        low = bitset & -bitset
+        yield low.bit_length() - 1
+        bitset ^= low
+
+
+class QueryError(ValueError):
+    pass
+
+
+class EventSearchIndex:
+    """Inverted token/trigram index plus facet bitmaps over the events.
+
+    Every event gets a slot number; postings are Python ints used as bitsets,
+    so combining predicates is a handful of ``&``/``|`` operations. Query
+    syntax (terms are ANDed)::
+
+        franklin            free text over description, city and county
+        county:franklin     field prefix match (also city:, desc:)
+        visited:no          facet (also independent:yes)
+        june                events overlapping that month, or mentioning the word
+        month:jun           events overlapping that month (name, abbreviation or number)
+        on:7/4/2025 after:6/1/2025 before:8/31/2025
+    """
+
+    def __init__(self, events=()):
+        self._slots = {}      # id -> slot
+        self._ids = []        # slot -> id (None when free)
+        self._free = []
+        self._docs = {}       # slot -> (lowercase field texts, start ordinal, end ordinal)
+        self._all = 0
+        self._tokens = {field: {} for field in FIELDS}
+        self._values = {field: {} for field in FIELDS}
+        self._trigrams = {}
+        self._vocabulary = None
+        self._visited = 0
+        self._independent = 0
+        self._months = {m: 0 for m in range(1, 13)}
+        for ev in events:
+            self.add(ev)
+
+    # --- maintenance ---
+    def add(self, ev):
+        if ev.id in self._slots:
+            self.remove(ev.id)
+        slot = self._free.pop() if self._free else len(self._ids)
+        if slot == len(self._ids):
+            self._ids.append(ev.id)
+        else:
+            self._ids[slot] = ev.id
+        self._slots[ev.id] = slot
+        bit = 1 << slot
+        texts = {field: getattr(ev, field).strip().lower() for field in FIELDS}
+        self._docs[slot] = (texts, ev.start_ordinal, ev.end_ordinal)
+        self._all |= bit
+        for field, text in texts.items():
+            for token in set(tokenize(text)):
+                self._tokens[field][token] = self._tokens[field].get(token, 0) | bit
+            self._values[field][text] = self._values[field].get(text, 0) | bit
+            for tri in _trigrams(text):
+                self._trigrams[tri] = self._trigrams.get(tri, 0) | bit
+        if ev.visited:
+            self._visited |= bit
+        if ev.independent:
+            self._independent |= bit
+        for month in self._months_spanned(ev.start_date, ev.end_date):
+            self._months[month] |= bit
+        self._vocabulary = None
+
+    def remove(self, event_id):
+        slot = self._slots.pop(event_id, None)
+        if slot is None:
+            return
+        mask = ~(1 << slot)
+        texts, _, _ = self._docs.pop(slot)
+        for field, text in texts.items():
+            self._clear(self._tokens[field], set(tokenize(text)), mask)
+            self._clear(self._values[field], (text,), mask)
+            self._clear(self._trigrams, _trigrams(text), mask)
+        self._all &= mask
+        self._visited &= mask
+        self._independent &= mask
+        for month in self._months:
+            self._months[month] &= mask
+        self._ids[slot] = None
+        self._free.append(slot)
+        self._vocabulary = None
+
+    def update(self, ev):
+        self.add(ev)
+
+    @staticmethod
+    def _clear(postings, keys, mask):
+        for key in keys:
+            remaining = postings.get(key, 0) & mask
+            if remaining:
+                postings[key] = remaining
+            else:
+                postings.pop(key, None)
+
+    @staticmethod
+    def _months_spanned(start, end):
+        months = set()
+        y, m = start.year, start.month
+        while (y, m) <= (end.year, end.month) and len(months) < 12:
+            months.add(m)
+            y, m = (y + 1, 1) if m == 12 else (y, m + 1)
+        return months
+
+    # --- querying ---
+    def search(self, query):
+        """Ids of the events matching ``query``, best match first; None for an empty query."""
+        try:
+            parts = shlex.split(query)
+        except ValueError:
+            parts = query.split()
+        if not parts:
+            return None
+        result = self._all
+        free_terms = []
+        date_filters = []
+        for part in parts:
+            key, sep, value = part.partition(":")
+            key = key.lower()
+            value = value.strip().lower()
+            if sep and key in FIELD_ALIASES:
+                result &= self._field_prefix(FIELD_ALIASES[key], value)
+            elif sep and key in ("visited", "independent"):
+                result &= self._facet(key, value)
+            elif sep and key in ("on", "after", "before"):
+                date_filters.append((key, self._ordinal(value)))
+            elif sep and key == "month":
+                result &= self._month(value)
+            elif part.lower() in MONTH_NAMES:
+                term = part.lower()
+                free_terms.append(term)
+                result &= self._months[MONTH_NAMES[term]] | self._term(term)
+            else:
+                for term in tokenize(part):
+                    free_terms.append(term)
+                    result &= self._term(term)
+            if not result:
+                return []
+
+        scored = []
+        for slot in _bits(result):
+            texts, start, end = self._docs[slot]
+            if not all(self._date_ok(op, ordinal, start, end) for op, ordinal in date_filters):
+                continue
+            scored.append((-self._score(texts, free_terms), start, texts["description"], self._ids[slot]))
+        scored.sort()
+        return [event_id for _, _, _, event_id in scored]
+
+    def _term(self, term):
+        if len(term) >= 3:
+            candidates = self._all
+            for tri in _trigrams(term):
+                candidates &= self._trigrams.get(tri, 0)
+                if not candidates:
+                    return 0
+            # Trigram hits are only candidates; confirm the substring is really there
+            matched = 0
+            for slot in _bits(candidates):
+                if any(term in text for text in self._docs[slot][0].values()):
+                    matched |= 1 << slot
+            return matched
+        # Too short for trigrams: prefix scan over the sorted token vocabulary
+        matched = 0
+        vocabulary = self._sorted_vocabulary()
+        i = bisect.bisect_left(vocabulary, (term,))
+        while i < len(vocabulary) and vocabulary[i][0].startswith(term):
+            token, field = vocabulary[i]
+            matched |= self._tokens[field][token]
+            i += 1
+        return matched
+
+    def _sorted_vocabulary(self):
+        if self._vocabulary is None:
+            self._vocabulary = sorted((token, field) for field in FIELDS for token in self._tokens[field])
+        return self._vocabulary
+
+    def _field_prefix(self, field, value):
+        matched = 0
+        for text, bits in self._values[field].items():
+            if text.startswith(value):
+                matched |= bits
+        return matched
+
+    def _facet(self, key, value):
+        bits = self._visited if key == "visited" else self._independent
+        if value in TRUE_WORDS:
+            return bits
+        if value in FALSE_WORDS:
+            return self._all & ~bits
+        raise QueryError(f"{key}: expects yes or no, got {value!r}")
+
+    def _month(self, value):
+        month = MONTHS.get(value) or (int(value) if value.isdigit() and 1 <= int(value) <= 12 else None)
+        if month is None:
+            raise QueryError(f"month: unknown month {value!r}")
+        return self._months[month]
+
+    @staticmethod
+    def _ordinal(value):
+        try:
+            return parse_event_date(value).toordinal()
+        except ValueError:
+            try:
+                return date.fromisoformat(value).toordinal()
+            except ValueError:
+                raise QueryError(f"unrecognized date {value!r}") from None
+
+    @staticmethod
+    def _date_ok(op, ordinal, start, end):
+        if op == "on":
+            return start <= ordinal <= end
+        if op == "after":
+            return end >= ordinal
+        return start <= ordinal
+
+    @staticmethod
+    def _score(texts, terms):
+        score = 0
+        for term in terms:
+            best = 0
+            for field, text in texts.items():
+                if term in tokenize(text):
+                    best = max(best, FIELD_WEIGHTS[field])
+                elif term in text:
+                    best = max(best, 1)
+            score += best
+        return score
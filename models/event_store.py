@@ -0,0 +1,69 @@
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from models.event_model import EventIndex
+from models.event_search import EventSearchIndex
+
+
+class EventStore(QObject):
+    """In-memory owner of the events, shared by every window.
+
+    Events are addressed by their stable ``id``; lookups go through the
+    repository's id index.
+
+    Mutations go through ``add``/``update``/``remove``, which keep the date
+    index current, append to the repository's change log and emit one signal
+    naming the affected event ids. ``events_updated`` and ``events_removed``
+    also carry the previous Event objects, so subscribers can find the cells,
+    counties and pins the old version occupied.
+    """
+
+    events_added = pyqtSignal(list)            # ids
+    events_updated = pyqtSignal(list, list)    # ids, previous events
+    events_removed = pyqtSignal(list, list)    # ids, removed events
+
+    def __init__(self, repo, parent=None):
+        super().__init__(parent)
+        self.repo = repo
+        events = repo.load_events()
+        self.index = EventIndex(events)
+        self.search_index = EventSearchIndex(events)
+        # Live view over the repository's id index: iteration follows file order and
+        # add/update/remove are dict operations rather than list searches
+        self.events = repo.events_by_id.values()
+
+    def get(self, event_id):
+        return self.repo.get(event_id)
+
+    def events_on(self, day):
+        return self.index.events_on(day)
+
+    def events_between(self, start, end):
+        return self.index.events_between(start, end)
+
+    def table(self):
+        """EventTable over the current in-memory events; rebuild it after edits."""
+        return self.repo.load_table()
+
+    def search(self, query):
+        """Ranked ids for a search query (see EventSearchIndex); None when the query is empty."""
+        return self.search_index.search(query)
+
+    def add(self, ev):
+        self.index.add(ev)
+        self.search_index.add(ev)
+        self.repo.record_added(ev)
+        self.events_added.emit([ev.id])
+
+    def update(self, ev):
+        old = self.repo.get(ev.id)
+        self.index.replace(old, ev)
+        self.search_index.update(ev)
+        self.repo.record_updated(ev)
+        self.events_updated.emit([ev.id], [old])
+
+    def remove(self, event_id):
+        old = self.repo.get(event_id)
+        self.index.remove(old)
+        self.search_index.remove(event_id)
+        self.repo.record_deleted(old)
+        self.events_removed.emit([event_id], [old])
@@ -0,0 +1,83 @@
+import numpy as np
+
+FLAG_INDEPENDENT = 1
+FLAG_VISITED = 2
+
+
+def pack_rgb(chip):
+    r, g, b = chip
+    return (r << 16) | (g << 8) | b
+
+
+def unpack_rgb(packed):
+    packed = int(packed)
+    return (packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF
+
+
+class EventTable:
+    """Columnar snapshot of a list of events for vectorized filtering.
+
+    Every column is a NumPy array aligned with ``self.events``; the ``mask_*``
+    methods return boolean masks that can be combined with ``&``/``|`` and
+    turned back into events with ``select``. Rebuild the table after edits.
+    """
+
+    def __init__(self, events):
+        self.events = list(events)
+        n = len(self.events)
+        self.start = np.fromiter((e.start_ordinal for e in self.events), dtype=np.int32, count=n)
+        self.end = np.fromiter((e.end_ordinal for e in self.events), dtype=np.int32, count=n)
+        self.county_names, self.county_id = self._categorize(e.county for e in self.events)
+        self.city_names, self.city_id = self._categorize(e.city for e in self.events)
+        self.flags = np.fromiter(
+            ((FLAG_INDEPENDENT if e.independent else 0) | (FLAG_VISITED if e.visited else 0) for e in self.events),
+            dtype=np.uint8, count=n)
+        self.rgb = np.fromiter((pack_rgb(e.chip) for e in self.events), dtype=np.uint32, count=n)
+
+    @staticmethod
+    def _categorize(values):
+        keys = [v.strip().upper() for v in values]
+        if not keys:
+            return np.array([], dtype=str), np.array([], dtype=np.int32)
+        names, ids = np.unique(np.array(keys, dtype=str), return_inverse=True)
+        return names, ids.astype(np.int32)
+
+    def __len__(self):
+        return len(self.events)
+
+    def _category_id(self, names, name):
+        key = name.strip().upper()
+        i = int(np.searchsorted(names, key))
+        return i if i < len(names) and names[i] == key else -1
+
+    def mask_between(self, start, end):
+        return (self.start <= end.toordinal()) & (self.end >= start.toordinal())
+
+    def mask_active_on(self, day):
+        return self.mask_between(day, day)
+
+    def mask_county(self, county):
+        return self.county_id == self._category_id(self.county_names, county)
+
+    def mask_city(self, city):
+        return self.city_id == self._category_id(self.city_names, city)
+
+    def mask_visited(self, visited=True):
+        has_flag = (self.flags & FLAG_VISITED) != 0
+        return has_flag if visited else ~has_flag
+
+    def mask_independent(self, independent=True):
+        has_flag = (self.flags & FLAG_INDEPENDENT) != 0
+        return has_flag if independent else ~has_flag
+
+    def select(self, mask):
+        return [self.events[i] for i in np.flatnonzero(mask)]
+
+    def active_on(self, day):
+        return self.select(self.mask_active_on(day))
+
+    def by_county(self, county):
+        return self.select(self.mask_county(county))
+
+    def visited(self, visited=True):
+        return self.select(self.mask_visited(visited))
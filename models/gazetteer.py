@@ -0,0 +1,109 @@
+import json
+import os
+import re
+from functools import lru_cache
+
+from models.map_bundle import load_map_bundle
+from models.map_geometry import ROOT_DIR
+
+ALIASES_PATH = os.path.join(ROOT_DIR, "data", "city_aliases.json")
+
+_PARENTHESIZED = re.compile(r" \(.*\)")
+_MOUNT = re.compile(r"\bMOUNT ")
+_WHITESPACE = re.compile(r"\s+")
+PLACE_SUFFIXES = (" CITY", " VILLAGE", " TOWN", " CORP", " CORPORATION")
+
+
+def _spelled_key(name):
+    """Upper-cased name with spacing, "(county)" qualifiers and "Mount" normalized, suffixes kept."""
+    key = _WHITESPACE.sub(" ", str(name).upper()).strip()
+    key = _PARENTHESIZED.sub("", key)
+    return _MOUNT.sub("MT. ", key)
+
+
+def normalize_place_name(name):
+    """Canonical lookup key shared by TIGER place names and event cities."""
+    key = _spelled_key(name)
+    # Only one legal-type suffix comes off: "Union City village" stays apart from "Union"
+    for suffix in PLACE_SUFFIXES:
+        if key.endswith(suffix) and len(key) > len(suffix):
+            key = key[: -len(suffix)].rstrip()
+            break
+    return key
+
+
+def load_aliases(path=ALIASES_PATH):
+    """Alias table as {(city key, county key or None): place key}."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+    except FileNotFoundError:
+        return {}
+    aliases = {}
+    for entry in entries:
+        county = entry.get("county")
+        county_key = county.strip().upper() if county else None
+        aliases[(normalize_place_name(entry["city"]), county_key)] = normalize_place_name(entry["place"])
+    return aliases
+
+
+class Gazetteer:
+    """Event city -> TIGER place resolution with memoized O(1) lookups.
+
+    Place names are normalized once at construction. When several places share
+    a name, the one inside the event's county wins.
+    """
+
+    def __init__(self, place_names, place_xy, place_county=None, county_names=None, aliases=None):
+        self.place_xy = place_xy
+        self.place_keys = [normalize_place_name(name) for name in place_names]
+        self.aliases = aliases or {}
+        self._county_ids = {str(name).upper(): i for i, name in enumerate(county_names if county_names is not None else [])}
+        self._place_county = place_county
+        self._by_key = {}
+        for idx, key in enumerate(self.place_keys):
+            self._by_key.setdefault(key, []).append(idx)
+        self._memo = {}
+
+    @classmethod
+    def from_bundle(cls, bundle, aliases=None):
+        return cls(bundle.place_names, bundle.place_xy, bundle.place_county, bundle.county_names,
+                   load_aliases() if aliases is None else aliases)
+
+    def resolve(self, city, county=None):
+        """Index of the place for an event city (optionally within ``county``), or None."""
+        county_key = county.strip().upper() if county else None
+        memo_key = (city, county_key)
+        if memo_key in self._memo:
+            return self._memo[memo_key]
+        key = normalize_place_name(city)
+        alias = self.aliases.get((key, county_key), self.aliases.get((key, None)))
+        if alias is not None:
+            key = alias
+            candidates = self._by_key.get(key, ())
+        else:
+            # As spelled first, so "Union City" doesn't lose its suffix and land on Union
+            candidates = self._by_key.get(_spelled_key(city)) or self._by_key.get(key, ())
+        # None for unmatched cities; the map window lists them next to its buttons
+        idx = self._pick(candidates, county_key)
+        self._memo[memo_key] = idx
+        return idx
+
+    def _pick(self, candidates, county_key):
+        if not candidates:
+            return None
+        if len(candidates) > 1 and county_key is not None and self._place_county is not None:
+            county_id = self._county_ids.get(county_key)
+            for idx in candidates:
+                if self._place_county[idx] == county_id:
+                    return idx
+        return candidates[0]
+
+    def xy(self, idx):
+        x, y = self.place_xy[idx]
+        return float(x), float(y)
+
+
+@lru_cache(maxsize=None)
+def load_gazetteer():
+    return Gazetteer.from_bundle(load_map_bundle())
@@ -0,0 +1,188 @@
+import json
+import os
+from functools import lru_cache
+
+import numpy as np
+
+from models.map_geometry import CACHE_DIR, TIGER_DIR, source_fingerprint
+from models.map_simplify import douglas_peucker, simplify_rings
+
+BUNDLE_VERSION = 4
+# Simplification tolerances (in map units, degrees) for LOD levels 1..n; level 0 is the source
+LOD_TOLERANCES = (0.0002, 0.0008, 0.003)
+BUNDLE_PATH = os.path.join(CACHE_DIR, "ohio_map_bundle.npz")
+
+
+class MapBundle:
+    """Flat NumPy form of the Ohio map layers.
+
+    Rings of every county are stored back to back in ``ring_coords``;
+    ``ring_offsets[r]:ring_offsets[r + 1]`` slices ring ``r`` and
+    ``county_ring_offsets[c]:county_ring_offsets[c + 1]`` gives the rings of
+    county ``c``. Exterior rings come first within a county, holes after.
+
+    Simplified copies of the rings are kept per level of detail: level ``k``
+    uses ``lod_ring_offsets[k]``/``lod_ring_coords[k]`` with the same ring
+    numbering, and level 0 is the full-resolution source. Road lines follow
+    the same scheme through ``road_offsets``/``road_coords``; the bundle holds
+    no roads when the TIGER roads layer was missing at build time.
+    """
+
+    def __init__(self, arrays):
+        self.county_names = arrays["county_names"]
+        self.county_label_xy = arrays["county_label_xy"]
+        self.county_ring_offsets = arrays["county_ring_offsets"]
+        self.ring_offsets = arrays["ring_offsets"]
+        self.ring_is_hole = arrays["ring_is_hole"]
+        self.ring_coords = arrays["ring_coords"]
+        self.place_names = arrays["place_names"]
+        self.place_xy = arrays["place_xy"]
+        self.place_county = arrays["place_county"]  # county index containing each place, -1 if none
+        self.county_bbox = arrays["county_bbox"]  # (xmin, ymin, xmax, ymax) per county
+        self.lod_tolerances = np.concatenate([[0.0], arrays["lod_tolerances"]])
+        self.lod_ring_offsets = [self.ring_offsets]
+        self.lod_ring_coords = [self.ring_coords]
+        for level in range(1, len(self.lod_tolerances)):
+            self.lod_ring_offsets.append(arrays[f"lod{level}_ring_offsets"])
+            self.lod_ring_coords.append(arrays[f"lod{level}_ring_coords"])
+        self.road_is_interstate = arrays["road_is_interstate"]
+        self.lod_road_offsets = [arrays["road_offsets"]]
+        self.lod_road_coords = [arrays["road_coords"]]
+        for level in range(1, len(self.lod_tolerances)):
+            self.lod_road_offsets.append(arrays[f"lod{level}_road_offsets"])
+            self.lod_road_coords.append(arrays[f"lod{level}_road_coords"])
+
+    @property
+    def county_count(self):
+        return len(self.county_names)
+
+    @property
+    def lod_count(self):
+        return len(self.lod_tolerances)
+
+    @property
+    def road_count(self):
+        return len(self.road_is_interstate)
+
+    def road(self, i, level=0):
+        offsets = self.lod_road_offsets[level]
+        return self.lod_road_coords[level][offsets[i]:offsets[i + 1]]
+
+    def ring(self, r, level=0):
+        offsets = self.lod_ring_offsets[level]
+        return self.lod_ring_coords[level][offsets[r]:offsets[r + 1]]
+
+    def county_rings(self, c, level=0):
+        """Yield (coords, is_hole) for each ring of county ``c`` at the given level of detail."""
+        for r in range(self.county_ring_offsets[c], self.county_ring_offsets[c + 1]):
+            yield self.ring(r, level), bool(self.ring_is_hole[r])
+
+
+def _polygons(geom):
+    if geom.geom_type == "Polygon":
+        return [geom]
+    if geom.geom_type == "MultiPolygon":
+        return list(geom.geoms)
+    return []
+
+
+def _lines(geom):
+    if geom.geom_type == "LineString":
+        return [geom]
+    if geom.geom_type in ("MultiLineString", "GeometryCollection"):
+        return [part for g in geom.geoms for part in _lines(g)]
+    return []
+
+
+def _flatten(lines):
+    offsets = np.concatenate([[0], np.cumsum([len(coords) for coords in lines])]).astype(np.int64)
+    coords = np.concatenate(lines) if lines else np.empty((0, 2))
+    return offsets, coords
+
+
+def build_map_bundle(tiger_dir=TIGER_DIR, out_path=BUNDLE_PATH):
+    from models.map_geometry import build_ohio_geometry
+
+    geometry = build_ohio_geometry(tiger_dir)
+
+    county_names, label_xy, bboxes = [], [], []
+    county_ring_offsets, ring_offsets, ring_is_hole, rings = [0], [0], [], []
+    for _, row in geometry.counties.iterrows():
+        county_names.append(row["NAME"].upper())
+        centroid = row["geometry"].centroid
+        label_xy.append((centroid.x, centroid.y))
+        bboxes.append(row["geometry"].bounds)
+        polygons = _polygons(row["geometry"])
+        exteriors = [np.asarray(poly.exterior.coords, dtype=np.float64) for poly in polygons]
+        holes = [np.asarray(interior.coords, dtype=np.float64)
+                 for poly in polygons for interior in poly.interiors]
+        for coords, is_hole in [(c, False) for c in exteriors] + [(c, True) for c in holes]:
+            rings.append(coords[:, :2])
+            ring_offsets.append(ring_offsets[-1] + len(coords))
+            ring_is_hole.append(is_hole)
+        county_ring_offsets.append(len(ring_is_hole))
+
+    places = geometry.places
+    place_county = np.full(len(places), -1, dtype=np.int32)
+    for c, county_geom in enumerate(geometry.counties.geometry):
+        place_county[np.asarray(places.within(county_geom))] = c
+
+    arrays = {
+        "version": np.array(BUNDLE_VERSION),
+        "fingerprint": np.array(json.dumps(source_fingerprint(tiger_dir))),
+        "county_names": np.array(county_names, dtype=str),
+        "county_label_xy": np.array(label_xy, dtype=np.float64).reshape(-1, 2),
+        "county_ring_offsets": np.array(county_ring_offsets, dtype=np.int64),
+        "ring_offsets": np.array(ring_offsets, dtype=np.int64),
+        "ring_is_hole": np.array(ring_is_hole, dtype=bool),
+        "ring_coords": np.concatenate(rings) if rings else np.empty((0, 2)),
+        "place_names": np.array([name.upper() for name in places["NAME"]], dtype=str),
+        "place_xy": np.column_stack([places.geometry.x, places.geometry.y]).astype(np.float64),
+        "place_county": place_county,
+        "county_bbox": np.array(bboxes, dtype=np.float64).reshape(-1, 4),
+        "lod_tolerances": np.array(LOD_TOLERANCES, dtype=np.float64),
+    }
+    # Counties share border vertices, so simplifying all rings together keeps the borders aligned
+    for level, lod_rings in enumerate(simplify_rings(rings, LOD_TOLERANCES), start=1):
+        arrays[f"lod{level}_ring_offsets"], arrays[f"lod{level}_ring_coords"] = _flatten(lod_rings)
+
+    roads, road_is_interstate = [], []
+    if geometry.roads is not None:
+        for road_type, geom in zip(geometry.roads["RTTYP"], geometry.roads.geometry):
+            for line in _lines(geom):
+                roads.append(np.asarray(line.coords, dtype=np.float64)[:, :2])
+                road_is_interstate.append(road_type == "I")
+    arrays["road_is_interstate"] = np.array(road_is_interstate, dtype=bool)
+    arrays["road_offsets"], arrays["road_coords"] = _flatten(roads)
+    for level, tolerance in enumerate(LOD_TOLERANCES, start=1):
+        lod_roads = [coords[douglas_peucker(coords, tolerance)] for coords in roads]
+        arrays[f"lod{level}_road_offsets"], arrays[f"lod{level}_road_coords"] = _flatten(lod_roads)
+
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    tmp_path = out_path + ".tmp.npz"
+    np.savez(tmp_path, **arrays)
+    os.replace(tmp_path, out_path)
+    return MapBundle(arrays)
+
+
+def _bundle_is_current(arrays, tiger_dir):
+    if "version" not in arrays or int(arrays["version"]) != BUNDLE_VERSION:
+        return False
+    fingerprint = source_fingerprint(tiger_dir)
+    if all(size is None for _, _, size in fingerprint):
+        # Shipped without the TIGER sources: the bundle is all we have
+        return True
+    return json.loads(str(arrays["fingerprint"])) == json.loads(json.dumps(fingerprint))
+
+
+@lru_cache(maxsize=None)
+def load_map_bundle(tiger_dir=TIGER_DIR, path=BUNDLE_PATH):
+    """Load the prebuilt bundle, rebuilding it first if the TIGER files changed."""
+    try:
+        with np.load(path, allow_pickle=False) as npz:
+            arrays = {key: npz[key] for key in npz.files}
+    except (OSError, ValueError, KeyError):
+        arrays = None
+    if arrays is not None and _bundle_is_current(arrays, tiger_dir):
+        return MapBundle(arrays)
+    return build_map_bundle(tiger_dir, path)
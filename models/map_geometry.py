@@ -0,0 +1,71 @@
+import os
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TIGER_DIR = os.path.join(ROOT_DIR, "TIGER")
+CACHE_DIR = os.path.join(ROOT_DIR, "data", "cache")
+
+COUNTY_LAYER = "cb_2024_us_county_500k"
+PLACE_LAYER = "tl_2024_39_place"
+ROADS_LAYER = "tl_2024_us_primaryroads"
+ROAD_TYPES = ("I", "U")  # interstates and US routes
+OHIO_STATEFP = "39"
+SHAPEFILE_PARTS = (".shp", ".shx", ".dbf")
+
+
+class OhioGeometry:
+    """Ohio-only slice of the TIGER layers that the map draws from."""
+
+    def __init__(self, counties, boundary, places, roads=None):
+        self.counties = counties  # GeoDataFrame: NAME + county polygons
+        self.boundary = boundary  # dissolved state outline
+        self.places = places      # GeoDataFrame: NAME + centroid points inside Ohio
+        self.roads = roads        # GeoDataFrame: RTTYP + lines clipped to Ohio, None without the layer
+
+
+def source_fingerprint(tiger_dir, layers=(COUNTY_LAYER, PLACE_LAYER, ROADS_LAYER)):
+    # (file, mtime, size) for every shapefile part the cache was built from
+    fingerprint = []
+    for layer in layers:
+        for ext in SHAPEFILE_PARTS:
+            path = os.path.join(tiger_dir, layer + ext)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                fingerprint.append((layer + ext, None, None))
+                continue
+            fingerprint.append((layer + ext, st.st_mtime_ns, st.st_size))
+    return tuple(fingerprint)
+
+
+def build_ohio_geometry(tiger_dir):
+    # geopandas is only needed here, so loading a prebuilt map bundle never imports it
+    import geopandas as gpd
+
+    counties = gpd.read_file(os.path.join(tiger_dir, COUNTY_LAYER + ".shp"))
+    counties = counties[counties["STATEFP"] == OHIO_STATEFP][["NAME", "geometry"]].reset_index(drop=True)
+    boundary = counties.unary_union
+
+    places = gpd.read_file(os.path.join(tiger_dir, PLACE_LAYER + ".shp"))
+    places = places[places.intersects(boundary)][["NAME", "geometry"]].reset_index(drop=True)
+    places["geometry"] = places.geometry.centroid
+    return OhioGeometry(counties, boundary, places, build_ohio_roads(tiger_dir, boundary, counties.crs))
+
+
+def build_ohio_roads(tiger_dir, boundary, crs=None):
+    """Interstates and US routes clipped to Ohio, or None if the roads layer isn't present.
+
+    The national layer is read with a bounding-box and attribute filter, so roads
+    in other states are never materialized; the remainder is clipped once.
+    """
+    import geopandas as gpd
+
+    path = os.path.join(tiger_dir, ROADS_LAYER + ".shp")
+    if not os.path.exists(path):
+        return None
+    types = ", ".join(f"'{t}'" for t in ROAD_TYPES)
+    roads = gpd.read_file(path, bbox=tuple(boundary.bounds), where=f"RTTYP IN ({types})",
+                          columns=["RTTYP"])
+    if crs is not None and roads.crs is not None and roads.crs != crs:
+        roads = roads.to_crs(crs)
+    roads = gpd.clip(roads[["RTTYP", "geometry"]], boundary)
+    return roads[~roads.geometry.is_empty].reset_index(drop=True)
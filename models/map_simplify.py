@@ -0,0 +1,121 @@
+import numpy as np
+
+
+def douglas_peucker(coords, tolerance):
+    """Return a boolean mask of the vertices of ``coords`` kept by Douglas-Peucker."""
+    n = len(coords)
+    keep = np.zeros(n, dtype=bool)
+    if n == 0:
+        return keep
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        start, end = coords[first], coords[last]
+        inner = coords[first + 1:last]
+        seg = end - start
+        seg_len2 = float(np.dot(seg, seg))
+        if seg_len2 == 0.0:
+            dist = np.hypot(*(inner - start).T)
+        else:
+            # Distance to the segment, not the infinite line, so closed arcs behave
+            t = np.clip(((inner - start) @ seg) / seg_len2, 0.0, 1.0)
+            dist = np.hypot(*(inner - (start + t[:, None] * seg)).T)
+        i = int(np.argmax(dist))
+        if dist[i] > tolerance:
+            split = first + 1 + i
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return keep
+
+
+def _vertex_ids(rings):
+    """Map every ring vertex to an integer id shared by identical coordinates."""
+    coords = np.concatenate(rings)
+    _, ids = np.unique(coords, axis=0, return_inverse=True)
+    ids = ids.reshape(-1)
+    out, start = [], 0
+    for ring in rings:
+        out.append(ids[start:start + len(ring)])
+        start += len(ring)
+    return out, coords, ids
+
+
+def _junctions(ring_ids, vertex_count):
+    """Vertices where three or more border arcs meet, i.e. with more than two distinct neighbours."""
+    neighbours = [set() for _ in range(vertex_count)]
+    for ids in ring_ids:
+        # Rings are closed (first == last), so the open part wraps around
+        open_ids = ids[:-1]
+        for prev_id, vid, next_id in zip(np.roll(open_ids, 1), open_ids, np.roll(open_ids, -1)):
+            neighbours[vid].add(int(prev_id))
+            neighbours[vid].add(int(next_id))
+    return np.array([len(n) > 2 for n in neighbours], dtype=bool)
+
+
+def _ring_arcs(ids, junction):
+    """Split a closed ring of vertex ids into arcs running between junction vertices."""
+    open_ids = list(ids[:-1])
+    stops = [i for i, vid in enumerate(open_ids) if junction[vid]]
+    if not stops:
+        # Start a junction-free ring at its lowest id so both sides pick the same anchor
+        start = open_ids.index(min(open_ids))
+        open_ids = open_ids[start:] + open_ids[:start]
+        return [open_ids + [open_ids[0]]]
+    rotated = open_ids[stops[0]:] + open_ids[:stops[0]]
+    stops = [s - stops[0] for s in stops] + [len(open_ids)]
+    rotated.append(rotated[0])
+    return [rotated[a:b + 1] for a, b in zip(stops, stops[1:])]
+
+
+def simplify_rings(rings, tolerances):
+    """Topology-preserving simplification of rings that share borders.
+
+    Borders are split into arcs at junction vertices; each arc is simplified once in
+    a canonical direction, and the surviving vertices form a global keep set. Two
+    rings sharing a border therefore keep exactly the same vertices along it.
+    Returns one list of simplified rings per tolerance.
+    """
+    if not rings:
+        return [[] for _ in tolerances]
+    ring_ids, _, ids = _vertex_ids(rings)
+    vertex_count = int(ids.max()) + 1
+    unique_coords = np.zeros((vertex_count, 2))
+    unique_coords[ids] = np.concatenate(rings)
+    junction = _junctions(ring_ids, vertex_count)
+
+    arcs = {}
+    for rid in ring_ids:
+        for arc in _ring_arcs(rid, junction):
+            # Shared arcs appear once per side, reversed; simplify them one way only
+            key = tuple(arc) if (arc[0], arc[1]) <= (arc[-1], arc[-2]) else tuple(reversed(arc))
+            arcs[key] = None
+    arcs = [np.array(key) for key in arcs]
+
+    levels = []
+    for tolerance in tolerances:
+        keep = junction.copy()
+        for arc in arcs:
+            if arc[0] == arc[-1] and not junction[arc[0]]:
+                # A ring with no neighbours: anchor it on its farthest vertex too
+                coords = unique_coords[arc]
+                far = int(np.argmax(np.hypot(*(coords - coords[0]).T)))
+                keep[arc[0]] = keep[arc[far]] = True
+                mask = douglas_peucker(coords[:far + 1], tolerance)
+                mask = np.concatenate([mask, douglas_peucker(coords[far:], tolerance)[1:]])
+            else:
+                mask = douglas_peucker(unique_coords[arc], tolerance)
+            keep[arc[mask]] = True
+        # A ring that collapses keeps all of its vertices, on every ring that shares them
+        for rid in ring_ids:
+            if np.count_nonzero(keep[rid[:-1]]) < 3:
+                keep[rid] = True
+        simplified = []
+        for rid in ring_ids:
+            kept = rid[:-1][keep[rid[:-1]]]
+            simplified.append(unique_coords[np.append(kept, kept[0])])
+        levels.append(simplified)
+    return levels
@@ -0,0 +1,151 @@
+import calendar
+from collections import OrderedDict
+from datetime import date, timedelta
+
+GRID_DAYS = 42
+
+
+class Segment:
+    """The part of one event that falls inside one week row of the month grid."""
+
+    __slots__ = ('event', 'week', 'col_start', 'col_end', 'lane', 'starts', 'ends')
+
+    def __init__(self, event, week, col_start, col_end, starts, ends):
+        self.event = event
+        self.week = week
+        self.col_start = col_start
+        self.col_end = col_end
+        self.lane = None
+        self.starts = starts  # the event's first day is in this row
+        self.ends = ends      # the event's last day is in this row
+
+
+class MonthLayout:
+    """Per-day event lists and lane-packed event bars for one 6x7 month grid.
+
+    ``day_events[i]`` lists the events on grid day ``i`` (ordered by start date
+    then description), ``weeks[w]`` holds the bar segments of week row ``w``
+    and ``hidden[i]`` counts events on day ``i`` that did not fit in
+    ``max_lanes`` lanes (the "+N more" count).
+    """
+
+    def __init__(self, year, month, grid_start, day_events, weeks, hidden, max_lanes):
+        self.year = year
+        self.month = month
+        self.grid_start = grid_start
+        self.day_events = day_events
+        self.weeks = weeks
+        self.hidden = hidden
+        self.max_lanes = max_lanes
+
+    def day(self, i):
+        return self.grid_start + timedelta(days=i)
+
+
+def grid_start_for(year, month):
+    """Sunday on or before the first of the month."""
+    first_weekday, _ = calendar.monthrange(year, month)
+    return date(year, month, 1) - timedelta(days=(first_weekday + 1) % 7)
+
+
+def layout_month(year, month, events, max_lanes=4):
+    """Lay out ``events`` (any that overlap the grid, ordered by start then description)."""
+    grid_start = grid_start_for(year, month)
+    first = grid_start.toordinal()
+    last = first + GRID_DAYS - 1
+
+    day_events = [[] for _ in range(GRID_DAYS)]
+    week_segments = [[] for _ in range(GRID_DAYS // 7)]
+    for ev in events:
+        lo = max(ev.start_ordinal, first) - first
+        hi = min(ev.end_ordinal, last) - first
+        if lo > hi:
+            continue
+        for i in range(lo, hi + 1):
+            day_events[i].append(ev)
+        for week in range(lo // 7, hi // 7 + 1):
+            col_start = max(lo, week * 7) - week * 7
+            col_end = min(hi, week * 7 + 6) - week * 7
+            starts = ev.start_ordinal == first + week * 7 + col_start
+            ends = ev.end_ordinal == first + week * 7 + col_end
+            week_segments[week].append(Segment(ev, week, col_start, col_end, starts, ends))
+
+    hidden = [0] * GRID_DAYS
+    for week, segments in enumerate(week_segments):
+        _pack_lanes(segments)
+        for seg in segments:
+            if seg.lane >= max_lanes:
+                for col in range(seg.col_start, seg.col_end + 1):
+                    hidden[week * 7 + col] += 1
+    return MonthLayout(year, month, grid_start, day_events, week_segments, hidden, max_lanes)
+
+
+def _pack_lanes(segments):
+    # Greedy interval packing: earliest column first, longer bars first on ties
+    segments.sort(key=lambda seg: (seg.col_start, seg.col_start - seg.col_end))
+    lane_ends = []
+    for seg in segments:
+        for lane, end in enumerate(lane_ends):
+            if end < seg.col_start:
+                seg.lane = lane
+                lane_ends[lane] = seg.col_end
+                break
+        else:
+            seg.lane = len(lane_ends)
+            lane_ends.append(seg.col_end)
+
+
+def adjacent_months(year, month):
+    prev_month = (year - 1, 12) if month == 1 else (year, month - 1)
+    next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return [prev_month, next_month]
+
+
+class MonthLayoutEngine:
+    """LRU cache of MonthLayouts, built with one range query per month.
+
+    ``query(start, end)`` must return the events overlapping [start, end]
+    ordered by start date then description (EventStore.events_between does).
+    Callers drop stale months with ``invalidate`` when events change.
+    """
+
+    def __init__(self, query, max_lanes=4, capacity=12):
+        self._query = query
+        self.max_lanes = max_lanes
+        self.capacity = capacity
+        self._cache = OrderedDict()
+
+    def __contains__(self, key):
+        return key in self._cache
+
+    def get(self, year, month):
+        key = (year, month)
+        layout = self._cache.get(key)
+        if layout is not None:
+            self._cache.move_to_end(key)
+            return layout
+        grid_start = grid_start_for(year, month)
+        events = self._query(grid_start, grid_start + timedelta(days=GRID_DAYS - 1))
+        layout = layout_month(year, month, events, self.max_lanes)
+        self._cache[key] = layout
+        while len(self._cache) > self.capacity:
+            self._cache.popitem(last=False)
+        return layout
+
+    def prefetch(self, year, month):
+        """Build a month ahead of time; returns True if there was work to do."""
+        if (year, month) in self._cache:
+            return False
+        self.get(year, month)
+        return True
+
+    def invalidate(self, events):
+        """Forget every cached month whose grid overlaps any of ``events``."""
+        for key, layout in list(self._cache.items()):
+            first = layout.grid_start.toordinal()
+            last = first + GRID_DAYS - 1
+            if any(ev.start_ordinal <= last and ev.end_ordinal >= first for ev in events):
+                del self._cache[key]
+
+    def clear(self):
+        self._cache.clear()
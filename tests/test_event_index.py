@@ -0,0 +1,71 @@
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from models.event_model import Event, EventIndex
+
+BASE = date(2025, 5, 1)
+
+
+def make_event(rng, n):
+    start = BASE + timedelta(days=rng.randrange(120))
+    end = start + timedelta(days=rng.choice([0, 0, 1, 3, 6, 13, 40]))
+    return Event(f"event {n:03d}", "FRANKLIN", "Columbus", False, False, start, end, (0, 0, 0), id=str(n))
+
+
+def brute_between(events, start, end):
+    lo, hi = start.toordinal(), end.toordinal()
+    hits = [ev for ev in events if ev.start_ordinal <= hi and ev.end_ordinal >= lo]
+    return sorted(hits, key=lambda ev: (ev.start_ordinal, ev.description))
+
+
+def check_against_scan(index, events, rng):
+    for _ in range(60):
+        start = BASE + timedelta(days=rng.randrange(-10, 140))
+        end = start + timedelta(days=rng.randrange(0, 35))
+        assert index.events_between(start, end) == brute_between(events, start, end)
+        assert index.events_on(start) == brute_between(events, start, start)
+
+
+def test_queries_match_a_full_scan():
+    rng = random.Random(8)
+    events = [make_event(rng, n) for n in range(200)]
+    check_against_scan(EventIndex(events), events, rng)
+
+
+def test_add_remove_replace_keep_the_index_exact():
+    rng = random.Random(80)
+    events = [make_event(rng, n) for n in range(150)]
+    index = EventIndex(events)
+    for n in range(150, 200):
+        ev = make_event(rng, n)
+        events.append(ev)
+        index.add(ev)
+    for ev in rng.sample(events, 40):
+        events.remove(ev)
+        index.remove(ev)
+    for i in rng.sample(range(len(events)), 30):
+        old = events[i]
+        new = make_event(rng, int(old.id))
+        events[i] = new
+        index.replace(old, new)
+    check_against_scan(index, events, rng)
+
+
+def test_long_event_found_from_its_last_day():
+    long = Event("long", "FRANKLIN", "Columbus", False, False, date(2025, 1, 1), date(2025, 12, 31), (0, 0, 0))
+    short = Event("short", "FRANKLIN", "Columbus", False, False, date(2025, 12, 30), date(2025, 12, 31), (0, 0, 0))
+    index = EventIndex([long, short])
+    assert index.events_on(datetime(2025, 12, 31, 15, 0)) == [long, short]
+    assert index.events_between(date(2026, 1, 1), date(2026, 1, 5)) == []
+
+
+def test_remove_matches_by_identity():
+    ev = Event("a", "FRANKLIN", "Columbus", False, False, BASE, BASE, (0, 0, 0), id="a")
+    twin = Event("a", "FRANKLIN", "Columbus", False, False, BASE, BASE, (0, 0, 0), id="a")
+    index = EventIndex([ev])
+    with pytest.raises(ValueError):
+        index.remove(twin)
+    index.remove(ev)
+    assert index.events_on(BASE) == []
@@ -0,0 +1,108 @@
+import json
+import os
+
+import pytest
+
+from models.event_model import Event, EventRepository
+
+
+def make_event(description, county="FRANKLIN", city="Columbus", start="6/7/2025", end="6/14/2025", id=None):
+    return Event(description, county, city, False, False, start, end, (26, 115, 232), id=id)
+
+
+@pytest.fixture
+def events_path(tmp_path):
+    path = tmp_path / "events.json"
+    path.write_text(json.dumps([
+        make_event("PAULDING (Paulding)", "PAULDING", "Paulding", id="a").to_dict(),
+        make_event("PICKAWAY (Circleville)", "PICKAWAY", "Circleville", id="b").to_dict(),
+    ]), encoding="utf-8")
+    return str(path)
+
+
+def reload(path):
+    return {ev.id: ev for ev in EventRepository(path).load_events()}
+
+
+def snapshot(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_add_update_delete_survive_reload(events_path):
+    repo = EventRepository(events_path)
+    loaded = {ev.id: ev for ev in repo.load_events()}
+    added = make_event("FRANKLIN (Columbus)")
+    repo.record_added(added)
+    repo.record_updated(make_event("PAULDING (Paulding) rescheduled", "PAULDING", "Paulding",
+                                   start="7/1/2025", end="7/3/2025", id="a"))
+    repo.record_deleted(loaded["b"])
+    # Changes only went to the log; the snapshot is untouched until compaction
+    assert os.path.exists(repo.log_path)
+    assert [e["id"] for e in snapshot(events_path)] == ["a", "b"]
+
+    events = reload(events_path)
+    assert set(events) == {"a", added.id}
+    assert events["a"].description == "PAULDING (Paulding) rescheduled"
+    assert events["a"].date_range_text() == "7/1/2025 – 7/3/2025"
+    assert events[added.id].city == "Columbus"
+
+
+def test_reload_folds_log_into_snapshot(events_path):
+    repo = EventRepository(events_path)
+    loaded = {ev.id: ev for ev in repo.load_events()}
+    repo.record_deleted(loaded["a"])
+
+    EventRepository(events_path).load_events()
+    assert not os.path.exists(repo.log_path)
+    assert [e["id"] for e in snapshot(events_path)] == ["b"]
+    # Replaying the same log over the new snapshot again would change nothing
+    assert set(reload(events_path)) == {"b"}
+
+
+def test_truncated_last_log_line_is_ignored(events_path):
+    repo = EventRepository(events_path)
+    repo.load_events()
+    repo.record_added(make_event("FRANKLIN (Columbus)", id="c"))
+    with open(repo.log_path, "a", encoding="utf-8") as f:
+        f.write('{"op": "delete", "id": "a"')  # crash mid-write
+
+    assert set(reload(events_path)) == {"a", "b", "c"}
+
+
+def test_compacts_every_n_records(events_path):
+    repo = EventRepository(events_path, compact_every=3)
+    loaded = {ev.id: ev for ev in repo.load_events()}
+    repo.record_added(make_event("one", id="c"))
+    repo.record_added(make_event("two", id="d"))
+    assert os.path.exists(repo.log_path)
+
+    repo.record_deleted(loaded["a"])
+    assert not os.path.exists(repo.log_path)
+    assert [e["id"] for e in snapshot(events_path)] == ["b", "c", "d"]
+    assert not [name for name in os.listdir(os.path.dirname(events_path)) if name.endswith(".tmp")]
+
+
+def test_first_load_assigns_and_keeps_ids(events_path):
+    raw = snapshot(events_path)
+    for record in raw:
+        del record["id"]
+    with open(events_path, "w", encoding="utf-8") as f:
+        json.dump(raw, f)
+
+    ids = [ev.id for ev in EventRepository(events_path).load_events()]
+    assert all(ids)
+    assert [e["id"] for e in snapshot(events_path)] == ids
+    assert [ev.id for ev in EventRepository(events_path).load_events()] == ids
+
+
+
+def test_load_table_does_not_reload_a_live_repository(events_path):
+    repo = EventRepository(events_path)
+    events = repo.load_events()
+    repo.record_added(make_event("FRANKLIN (Columbus)", id="c"))
+
+    table = repo.load_table()
+    assert len(table) == 3
+    assert [repo.get(ev.id) for ev in events] == events
+    assert os.path.exists(repo.log_path)
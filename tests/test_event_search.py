@@ -0,0 +1,46 @@
+import pytest
+
+from models.event_model import Event
+from models.event_search import EventSearchIndex, QueryError
+
+
+def make_event(id, description, county, city, start, end, visited=False):
+    return Event(description, county, city, False, visited, start, end, (26, 115, 232), id=id)
+
+
+@pytest.fixture
+def index():
+    return EventSearchIndex([
+        make_event("marion", "MARION (Marion)", "MARION", "Marion", "8/20/2025", "8/25/2025"),
+        make_event("marietta", "WASHINGTON (Marietta)", "WASHINGTON", "Marietta", "9/1/2025", "9/6/2025"),
+        make_event("auglaize", "AUGLAIZE (Wapakoneta)", "AUGLAIZE", "Wapakoneta", "7/21/2025", "7/26/2025"),
+        make_event("franklin", "Ohio State Fair", "FRANKLIN", "Columbus", "7/30/2025", "8/10/2025", visited=True),
+    ])
+
+
+def test_month_abbreviations_are_free_text(index):
+    assert sorted(index.search("mar")) == ["marietta", "marion"]
+    assert index.search("aug") == ["auglaize"]
+
+
+def test_full_month_names_and_month_facet(index):
+    assert sorted(index.search("august")) == ["franklin", "marion"]
+    assert sorted(index.search("month:aug")) == ["franklin", "marion"]
+    assert sorted(index.search("month:7")) == ["auglaize", "franklin"]
+    with pytest.raises(QueryError):
+        index.search("month:smarch")
+
+
+def test_terms_and_facets_combine(index):
+    assert index.search("county:mar") == ["marion"]
+    assert index.search("visited:yes") == ["franklin"]
+    assert index.search("august visited:no") == ["marion"]
+    assert index.search("on:9/3/2025") == ["marietta"]
+    assert index.search("   ") is None
+
+
+def test_remove_and_update(index):
+    index.remove("marion")
+    assert index.search("mar") == ["marietta"]
+    index.update(make_event("marietta", "WASHINGTON (Marietta)", "WASHINGTON", "Marietta", "8/1/2025", "8/2/2025"))
+    assert sorted(index.search("august")) == ["franklin", "marietta"]
@@ -0,0 +1,37 @@
+import numpy as np
+
+from models.gazetteer import Gazetteer, normalize_place_name
+
+
+def make_gazetteer(aliases=None):
+    names = ["Union", "Union City village", "Mount Vernon city", "Lakewood", "Lakewood"]
+    xy = np.arange(len(names) * 2, dtype=float).reshape(-1, 2)
+    return Gazetteer(names, xy, place_county=np.array([0, 1, 2, 3, 4]),
+                     county_names=["MIAMI", "DARKE", "KNOX", "CUYAHOGA", "AUGLAIZE"], aliases=aliases)
+
+
+def test_normalize_strips_one_suffix():
+    assert normalize_place_name("Union City village") == "UNION CITY"
+    assert normalize_place_name("Mount  Vernon city") == "MT. VERNON"
+    assert normalize_place_name("Lakewood (Cuyahoga)") == "LAKEWOOD"
+    assert normalize_place_name("Village") == "VILLAGE"
+
+
+def test_resolve_keeps_similar_names_apart():
+    gazetteer = make_gazetteer()
+    assert gazetteer.resolve("Union") == 0
+    assert gazetteer.resolve("Union City") == 1
+    assert gazetteer.resolve("Mt. Vernon", "knox") == 2
+
+
+def test_resolve_prefers_the_event_county():
+    gazetteer = make_gazetteer()
+    assert gazetteer.resolve("Lakewood", "AUGLAIZE") == 4
+    assert gazetteer.resolve("Lakewood", "CUYAHOGA") == 3
+    assert gazetteer.resolve("Lakewood") == 3
+
+
+def test_aliases_and_unmatched_cities():
+    gazetteer = make_gazetteer(aliases={("BARLOW", None): "UNION"})
+    assert gazetteer.resolve("Barlow") == 0
+    assert gazetteer.resolve("Nowhere", "KNOX") is None
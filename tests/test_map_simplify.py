@@ -0,0 +1,80 @@
+import numpy as np
+
+from models.map_bundle import LOD_TOLERANCES
+from models.map_simplify import douglas_peucker, simplify_rings
+
+CELLS = 3
+POINTS_PER_EDGE = 60
+
+
+def wiggly_grid(seed=21):
+    """Closed rings for a CELLS x CELLS grid of cells whose shared edges are noisy polylines."""
+    rng = np.random.default_rng(seed)
+    step = 0.1
+    t = np.linspace(0.0, 1.0, POINTS_PER_EDGE)[1:-1]
+    edges = {}
+
+    def edge(a, b):
+        # One polyline per lattice edge, shared by both cells beside it
+        if (b, a) in edges:
+            return edges[(b, a)][::-1]
+        if (a, b) not in edges:
+            p, q = np.array(a, dtype=float) * step, np.array(b, dtype=float) * step
+            normal = np.array([-(q - p)[1], (q - p)[0]])
+            inner = p + t[:, None] * (q - p) + rng.normal(0.0, 0.004, len(t))[:, None] * normal
+            edges[(a, b)] = np.vstack([p, inner, q])
+        return edges[(a, b)]
+
+    rings = []
+    for i in range(CELLS):
+        for j in range(CELLS):
+            corners = [(i, j), (i + 1, j), (i + 1, j + 1), (i, j + 1), (i, j)]
+            parts = [edge(a, b)[:-1] for a, b in zip(corners, corners[1:])]
+            # Start each ring at an arbitrary vertex, as TIGER rings do, so sides don't share anchors
+            ring = np.roll(np.vstack(parts), -int(rng.integers(len(t) * 4)), axis=0)
+            rings.append(np.vstack([ring, ring[:1]]))
+    return rings
+
+
+def as_set(coords):
+    return {tuple(xy) for xy in coords}
+
+
+def test_shared_borders_keep_identical_vertices_at_every_level():
+    rings = wiggly_grid()
+    levels = simplify_rings(rings, LOD_TOLERANCES)
+    assert len(levels) == len(LOD_TOLERANCES)
+    original = [as_set(ring) for ring in rings]
+    for simplified in levels:
+        kept = [as_set(ring) for ring in simplified]
+        for a in range(len(rings)):
+            for b in range(a + 1, len(rings)):
+                shared = original[a] & original[b]
+                assert kept[a] & shared == kept[b] & shared
+
+
+def test_levels_get_coarser_and_stay_closed():
+    rings = wiggly_grid()
+    levels = simplify_rings(rings, LOD_TOLERANCES)
+    counts = [sum(len(ring) for ring in simplified) for simplified in levels]
+    assert counts[0] < sum(len(ring) for ring in rings)
+    assert counts == sorted(counts, reverse=True)
+    for simplified in levels:
+        for ring, source in zip(simplified, rings):
+            assert len(ring) >= 4
+            assert np.array_equal(ring[0], ring[-1])
+            assert as_set(ring) <= as_set(source)
+
+
+def test_lattice_corners_survive():
+    rings = wiggly_grid()
+    corners = {(i * 0.1, j * 0.1) for i in range(1, CELLS) for j in range(1, CELLS)}
+    for simplified in simplify_rings(rings, LOD_TOLERANCES):
+        kept = set().union(*(as_set(ring) for ring in simplified))
+        assert corners <= kept
+
+
+def test_douglas_peucker_keeps_points_beyond_tolerance():
+    coords = np.array([[0.0, 0.0], [1.0, 0.05], [2.0, 0.0], [3.0, 1.0], [4.0, 0.0]])
+    assert douglas_peucker(coords, 0.1).tolist() == [True, False, True, True, True]
+    assert douglas_peucker(coords, 2.0).tolist() == [True, False, False, False, True]
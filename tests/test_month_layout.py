@@ -0,0 +1,82 @@
+import random
+from datetime import date, timedelta
+
+from models.event_model import Event, EventIndex
+from models.month_layout import GRID_DAYS, MonthLayoutEngine, grid_start_for, layout_month
+
+
+def make_event(description, start, end):
+    return Event(description, "FRANKLIN", "Columbus", False, False, start, end, (0, 0, 0), id=description)
+
+
+def ordered(events):
+    return sorted(events, key=lambda ev: (ev.start_ordinal, ev.description))
+
+
+def check_layout(layout, events):
+    first = layout.grid_start.toordinal()
+    for i in range(GRID_DAYS):
+        on_day = [ev for ev in ordered(events) if ev.start_ordinal <= first + i <= ev.end_ordinal]
+        assert layout.day_events[i] == on_day
+    for week, segments in enumerate(layout.weeks):
+        lanes = {}
+        for seg in segments:
+            cols = set(range(seg.col_start, seg.col_end + 1))
+            assert not cols & lanes.get(seg.lane, set()), "two bars share a lane cell"
+            lanes.setdefault(seg.lane, set()).update(cols)
+        for col in range(7):
+            i = week * 7 + col
+            shown = sum(1 for seg in segments if seg.col_start <= col <= seg.col_end and seg.lane < layout.max_lanes)
+            assert shown + layout.hidden[i] == len(layout.day_events[i])
+
+
+def test_grid_starts_on_the_sunday_before_the_first():
+    assert grid_start_for(2025, 6) == date(2025, 6, 1)
+    assert grid_start_for(2025, 7) == date(2025, 6, 29)
+
+
+def test_event_crossing_a_week_is_split_into_row_segments():
+    ev = make_event("fair", date(2025, 6, 5), date(2025, 6, 10))  # Thursday to Tuesday
+    layout = layout_month(2025, 6, [ev])
+    (first,), (second,) = layout.weeks[0], layout.weeks[1]
+    assert (first.col_start, first.col_end, first.starts, first.ends) == (4, 6, True, False)
+    assert (second.col_start, second.col_end, second.starts, second.ends) == (0, 2, False, True)
+
+
+def test_more_counts_across_a_week_boundary():
+    # Five events cover Saturday 6/7 and Sunday 6/8; only four fit
+    events = ordered([make_event(f"e{n}", date(2025, 6, 6 + n % 2), date(2025, 6, 8 + n % 3)) for n in range(5)])
+    layout = layout_month(2025, 6, events)
+    check_layout(layout, events)
+    assert layout.hidden[6] == 1  # Saturday
+    assert layout.hidden[7] == 1  # Sunday, first day of the next row
+    assert max(seg.lane for seg in layout.weeks[1]) == 4
+
+
+def test_random_months_pack_without_overlap():
+    rng = random.Random(17)
+    for _ in range(20):
+        events = []
+        for n in range(rng.randrange(5, 40)):
+            start = date(2025, 5, 20) + timedelta(days=rng.randrange(50))
+            events.append(make_event(f"e{n:02d}", start, start + timedelta(days=rng.choice([0, 1, 2, 4, 9, 20]))))
+        index = EventIndex(events)
+        grid_start = grid_start_for(2025, 6)
+        in_grid = index.events_between(grid_start, grid_start + timedelta(days=GRID_DAYS - 1))
+        check_layout(layout_month(2025, 6, in_grid, max_lanes=3), in_grid)
+
+
+def test_engine_invalidates_only_overlapping_months():
+    events = [make_event("june", date(2025, 6, 10), date(2025, 6, 12))]
+    index = EventIndex(events)
+    engine = MonthLayoutEngine(index.events_between, capacity=3)
+    for month in (4, 5, 6, 9):
+        engine.get(2025, month)
+    assert (2025, 4) not in engine  # least recently used, beyond capacity
+    june = engine.get(2025, 6)
+    assert engine.get(2025, 6) is june
+
+    engine.invalidate([make_event("late may", date(2025, 5, 30), date(2025, 6, 2))])
+    # May's grid runs to 6/7 and June's starts 6/1; September's is untouched
+    assert (2025, 5) not in engine and (2025, 6) not in engine
+    assert (2025, 9) in engine
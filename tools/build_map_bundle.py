@@ -0,0 +1,25 @@
+"""Compile the TIGER shapefiles into the NumPy map bundle used by MapView.
+
+    python -m tools.build_map_bundle TIGER/
+"""
+import argparse
+import time
+
+from models.map_bundle import BUNDLE_PATH, build_map_bundle
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("tiger_dir", nargs="?", default="TIGER", help="directory holding the TIGER shapefiles")
+    parser.add_argument("-o", "--output", default=BUNDLE_PATH, help="bundle file to write (.npz)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    bundle = build_map_bundle(args.tiger_dir, args.output)
+    elapsed = time.perf_counter() - start
+    print(f"Wrote {args.output}: {bundle.county_count} counties, {len(bundle.ring_offsets) - 1} rings, "
+          f"{len(bundle.ring_coords)} vertices, {len(bundle.place_names)} places ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
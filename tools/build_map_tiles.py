@@ -0,0 +1,34 @@
+"""Render the static Ohio base map into a z/x/y PNG tile pyramid for MapView's tile mode.
+
+    python -m tools.build_map_tiles TIGER/ [--max-zoom 4] [--roads]
+"""
+import argparse
+import signal
+import sys
+import time
+
+from models.map_bundle import load_map_bundle
+from views.map_render_worker import build_scene
+from views.map_tiles import MAX_ZOOM, TILE_DIR, build_map_tiles
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("tiger_dir", nargs="?", default="TIGER", help="directory holding the TIGER shapefiles")
+    parser.add_argument("-o", "--output", default=TILE_DIR, help="directory to write the tiles to")
+    parser.add_argument("--max-zoom", type=int, default=MAX_ZOOM, help="deepest zoom level to render")
+    parser.add_argument("--roads", action="store_true", help="bake interstates and US routes into the tiles")
+    args = parser.parse_args(argv)
+    # The app stops superseded builds with SIGTERM; exiting normally lets build_map_tiles drop its temp dir
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(1))
+
+    start = time.perf_counter()
+    scene = build_scene(load_map_bundle(args.tiger_dir))
+    grid = build_map_tiles(scene, args.output, args.max_zoom, args.roads, args.tiger_dir)
+    elapsed = time.perf_counter() - start
+    tiles = sum((1 << z) ** 2 for z in range(grid.max_zoom + 1))
+    print(f"Wrote {args.output}: zoom 0-{grid.max_zoom} (up to {tiles} tiles of {grid.tile_size}px) ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
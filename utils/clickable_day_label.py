@@ -6,10 +6,17 @@ from PyQt6.QtCore import pyqtSignal
 class ClickableDayLabel(QLabel):
     clicked = pyqtSignal(datetime.datetime)  # Pass day as int
 
-    def __init__(self, dt, parent=None):
+    def __init__(self, dt=None, parent=None):
         super().__init__(parent)
-        self._date = dt
-        self.setText(str(dt.day))
+        self._date = None
+        if dt is not None:
+            self.set_date(dt)
+
+    def set_date(self, dt):
+        # Cells are reused across months, so the date can change after construction
+        if dt != self._date:
+            self._date = dt
+            self.setText(str(dt.day))
 
     def mousePressEvent(self, event):
         # print(f"Day label clicked: {self._date}")
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 
 def parse_date(date_str):
     # Supports "6/7/2025"
@@ -6,3 +6,15 @@ def parse_date(date_str):
 
 def format_date(dt):
     return dt.strftime("%m/%d/%Y")
+
+def parse_event_date(value):
+    # events.json stores "6/7/2025"; already-typed values pass through
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return parse_date(value).date()
+
+def format_event_date(d):
+    # Inverse of parse_event_date, without zero padding: "6/7/2025"
+    return f"{d.month}/{d.day}/{d.year}"
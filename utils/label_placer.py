@@ -0,0 +1,61 @@
+import math
+
+
+class LabelPlacer:
+    """Greedy screen-space label placement over a spatial hash of pixel rectangles.
+
+    Callers offer labels in priority order; each one is kept only if its
+    rectangle overlaps nothing placed before it.
+    """
+
+    def __init__(self, cell_size=48, padding=2):
+        self.cell_size = float(cell_size)
+        self.padding = padding
+        self.cells = {}
+
+    def clear(self):
+        self.cells.clear()
+
+    def _cells(self, rect):
+        x0, y0, x1, y1 = rect
+        size = self.cell_size
+        for cx in range(math.floor(x0 / size), math.floor(x1 / size) + 1):
+            for cy in range(math.floor(y0 / size), math.floor(y1 / size) + 1):
+                yield cx, cy
+
+    def occupy(self, rect):
+        """Reserve a rectangle unconditionally (pin markers, for instance)."""
+        for cell in self._cells(rect):
+            self.cells.setdefault(cell, []).append(rect)
+
+    def collides(self, rect):
+        x0, y0, x1, y1 = rect
+        for cell in self._cells(rect):
+            for ox0, oy0, ox1, oy1 in self.cells.get(cell, ()):
+                if x0 < ox1 and ox0 < x1 and y0 < oy1 and oy0 < y1:
+                    return True
+        return False
+
+    def try_place(self, rect):
+        # Leave a little air around the text so neighbouring label boxes don't touch
+        x0, y0, x1, y1 = rect
+        rect = (x0 - self.padding, y0 - self.padding, x1 + self.padding, y1 + self.padding)
+        if self.collides(rect):
+            return False
+        self.occupy(rect)
+        return True
+
+
+class TextExtentCache:
+    """Pixel size of a label's text, measured once per string, font size and DPI."""
+
+    def __init__(self):
+        self.sizes = {}
+
+    def size(self, text_artist, renderer, dpi):
+        key = (text_artist.get_text(), text_artist.get_fontsize(), dpi)
+        size = self.sizes.get(key)
+        if size is None:
+            extent = text_artist.get_window_extent(renderer)
+            size = self.sizes[key] = (extent.width, extent.height)
+        return size
@@ -0,0 +1,20 @@
+from PyQt6.QtCore import QSettings
+
+ORGANIZATION = "OhioFairVisualizer"
+APPLICATION = "OhioFairVisualizer"
+
+
+def get_setting(key, default=None):
+    return QSettings(ORGANIZATION, APPLICATION).value(key, default)
+
+
+def set_setting(key, value):
+    QSettings(ORGANIZATION, APPLICATION).setValue(key, value)
+
+
+def get_flag(key, default=False):
+    # QSettings hands booleans back as "true"/"false" strings on INI-backed platforms
+    value = get_setting(key, default)
+    if isinstance(value, str):
+        return value.lower() == "true"
+    return bool(value)
@@ -0,0 +1,61 @@
+import math
+
+import numpy as np
+
+
+class GridIndex:
+    """Uniform grid over a fixed set of 2-D points for nearest-within-radius queries.
+
+    Build it once per point set; each query only visits the grid cells that the
+    search ellipse overlaps.
+    """
+
+    def __init__(self, points, cell_size=None):
+        self.points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if cell_size is None:
+            cell_size = self._default_cell_size(self.points)
+        self.cell_size = cell_size
+        self.cells = {}
+        if len(self.points):
+            keys = np.floor(self.points / cell_size).astype(np.int64)
+            for idx, key in enumerate(map(tuple, keys.tolist())):
+                self.cells.setdefault(key, []).append(idx)
+
+    @staticmethod
+    def _default_cell_size(points):
+        # Aim for roughly one point per cell over the bounding box
+        if len(points) < 2:
+            return 1.0
+        span = np.ptp(points, axis=0)
+        area = float(span[0] * span[1])
+        if area <= 0:
+            return float(max(span.max(), 1.0))
+        return math.sqrt(area / len(points))
+
+    def __len__(self):
+        return len(self.points)
+
+    def nearest(self, x, y, radius_x, radius_y=None):
+        """Index of the point closest to (x, y) inside the given radii, or None.
+
+        Separate x/y radii let a pixel radius be converted to data units on axes
+        whose scales differ.
+        """
+        if radius_y is None:
+            radius_y = radius_x
+        if not self.cells or radius_x <= 0 or radius_y <= 0:
+            return None
+        cs = self.cell_size
+        i0, i1 = math.floor((x - radius_x) / cs), math.floor((x + radius_x) / cs)
+        j0, j1 = math.floor((y - radius_y) / cs), math.floor((y + radius_y) / cs)
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > len(self.cells):
+            candidates = range(len(self.points))
+        else:
+            candidates = [idx for i in range(i0, i1 + 1) for j in range(j0, j1 + 1)
+                          for idx in self.cells.get((i, j), ())]
+        if not candidates:
+            return None
+        candidates = np.fromiter(candidates, dtype=np.int64)
+        d = ((self.points[candidates, 0] - x) / radius_x) ** 2 + ((self.points[candidates, 1] - y) / radius_y) ** 2
+        best = int(np.argmin(d))
+        return int(candidates[best]) if d[best] < 1.0 else None
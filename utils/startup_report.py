@@ -0,0 +1,35 @@
+import sys
+import time
+
+# Packages that should stay out of the process until the map window is built
+HEAVY_MODULES = ("numpy", "matplotlib", "geopandas", "shapely")
+
+_start = time.perf_counter()
+_marks = []
+_enabled = False
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def mark(label):
+    """Record a startup milestone with the heavy packages imported so far."""
+    if not _enabled:
+        return
+    loaded = [name for name in HEAVY_MODULES if name in sys.modules]
+    _marks.append((label, time.perf_counter() - _start, len(sys.modules), loaded))
+    if label == "map first frame":
+        report()
+
+
+def report(stream=None):
+    stream = stream or sys.stderr
+    print("startup report (ms since first import, modules loaded, heavy packages)", file=stream)
+    previous = 0.0
+    for label, elapsed, module_count, loaded in _marks:
+        print(f"  {elapsed * 1000:8.1f}  (+{(elapsed - previous) * 1000:7.1f})  {module_count:5d}  "
+              f"{label:<20} {', '.join(loaded) or '-'}", file=stream)
+        previous = elapsed
+    print("  run with `python -X importtime main.py` for a per-module breakdown", file=stream)
@@ -1,15 +1,17 @@
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QGridLayout, QFrame, QSizePolicy
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QGridLayout, QFrame, QSizePolicy, QWIDGETSIZE_MAX,
+    QStackedWidget
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6 import QtWidgets, QtCore
-from PyQt6.QtGui import QColor
 
 from utils.clickable_day_label import ClickableDayLabel
-from utils.date_utils import parse_date
 import calendar
 from datetime import datetime, timedelta
 from views.day_events_dialog import DayEventsDialog
+from views.month_grid_widget import MonthGridWidget
+from models.month_layout import MonthLayoutEngine, adjacent_months
+from utils.settings import get_setting, set_setting
 
 # Clickable QLabel for '+x more' labels
 class ClickableLabel(QLabel):
@@ -18,12 +20,127 @@ class ClickableLabel(QLabel):
         self.clicked.emit()
         super().mouseReleaseEvent(event)
 
+VISIBLE_EVENTS = 4
+MODE_CELLS = "cells"      # one pooled widget per day
+MODE_PAINTED = "painted"  # single custom-painted month with multi-day bars
+TODAY_SIZE = 20  # Diameter in pixels
+TODAY_STYLE = """
+    background-color: #a8c7fa;
+    /* border: 1px solid white; */
+    border-radius: 10px;  /* Half the diameter */
+    color: black;
+    font-weight: bold;
+    padding: 0px;
+    margin: 0px;
+"""
+OTHER_MONTH_STYLE = "color: #aaa;"
+LEFT_BORDER = "border-top-left-radius: 5px; border-bottom-left-radius: 5px; "
+RIGHT_BORDER = "border-top-right-radius: 5px; border-bottom-right-radius: 5px; "
+
+
+def event_chip_style(chip, is_start, is_end):
+    r, g, b = chip
+    style = f"background: rgb({r},{g},{b}); color: #fff; padding:1px 2px; font-size:11px; "
+    if is_start:
+        style += LEFT_BORDER
+    if is_end:
+        style += RIGHT_BORDER
+    return style
+
+
+class DayCell(QFrame):
+    """One reusable day cell: a day number, VISIBLE_EVENTS chip slots and a '+N more' link.
+
+    The widgets are created once; set_day only changes text, visibility and,
+    when it actually differs, the style sheet.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.date = None
+        self.events = []
+        self._styles = {}
+        self.setFrameShape(QFrame.Shape.StyledPanel)
+        cell_layout = QVBoxLayout(self)
+        cell_layout.setContentsMargins(2, 2, 2, 2)
+        cell_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+
+        self.day_label = ClickableDayLabel()
+        self.day_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        # Create horizontal layout for the day label to center it
+        h_layout = QtWidgets.QHBoxLayout()
+        h_layout.addStretch(1)
+        h_layout.addWidget(self.day_label)
+        h_layout.addStretch(1)
+        h_layout.setContentsMargins(0, 0, 0, 0)
+        cell_layout.addLayout(h_layout)
+
+        self.event_labels = []
+        for _ in range(VISIBLE_EVENTS):
+            ev_label = QLabel()
+            ev_label.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Minimum)
+            ev_label.hide()
+            cell_layout.addWidget(ev_label)
+            self.event_labels.append(ev_label)
+
+        self.more_label = ClickableLabel()
+        self.more_label.setStyleSheet("color: #999; font-size:10px; text-decoration: underline;")
+        self.more_label.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.more_label.hide()
+        cell_layout.addWidget(self.more_label)
+        self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Minimum)
+
+    def _set_style(self, widget, style):
+        # Style sheet parsing is the expensive part, so only re-apply on change
+        if self._styles.get(id(widget)) != style:
+            widget.setStyleSheet(style)
+            self._styles[id(widget)] = style
+
+    def set_day(self, date, events, is_current_month, is_today):
+        self.date = date
+        self.events = events
+        self.day_label.set_date(date)
+        if is_today:
+            self.day_label.setFixedSize(TODAY_SIZE, TODAY_SIZE)
+            self._set_style(self.day_label, TODAY_STYLE)
+        else:
+            self.day_label.setMinimumSize(0, 0)
+            self.day_label.setMaximumSize(QWIDGETSIZE_MAX, QWIDGETSIZE_MAX)
+            self._set_style(self.day_label, "" if is_current_month else OTHER_MONTH_STYLE)
+
+        cur = date.date()
+        for ev_label, ev in zip(self.event_labels, events):
+            ev_label.setText(ev.description)
+            self._set_style(ev_label, event_chip_style(ev.chip, cur == ev.start_date, cur == ev.end_date))
+            ev_label.setToolTip(f"{ev.description}\n{ev.date_range_text()}")
+            ev_label.show()
+        for ev_label in self.event_labels[len(events):]:
+            ev_label.hide()
+
+        if len(events) > VISIBLE_EVENTS:
+            self.more_label.setText(f"+{len(events) - VISIBLE_EVENTS} more")
+            self.more_label.show()
+        else:
+            self.more_label.hide()
+
+
 class CalendarView(QWidget):
     day_clicked  = pyqtSignal(object)
+    first_painted = pyqtSignal()
 
-    def __init__(self, events, parent=None):
+    def __init__(self, event_store, mode=None, parent=None):
         super().__init__(parent)
-        self.events = events
+        self.event_store = event_store
+        self.events = event_store.events
+        self.mode = mode or get_setting("calendar/mode", MODE_CELLS)
+        self.month_grid = None
+        self.layouts = MonthLayoutEngine(event_store.events_between, VISIBLE_EVENTS)
+        # Neighbouring months are laid out one per idle tick so flipping months is a cache hit
+        self.prefetch_queue = []
+        self.prefetch_timer = QTimer(self)
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.setInterval(0)
+        self.prefetch_timer.timeout.connect(self.prefetch_next)
         self.resize(1000, 800)
         self.today = datetime.today()
         self.current_date = datetime(self.today.year, self.today.month, 1)
@@ -32,9 +149,20 @@ class CalendarView(QWidget):
         self.current_month = self.today.month
         self.selected_date = None
         self.select_day_events = None
+        self.painted = False
 
         self.init_ui()
         self.refresh()
+        event_store.events_added.connect(self.on_events_changed)
+        event_store.events_updated.connect(self.on_events_changed)
+        event_store.events_removed.connect(self.on_events_changed)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.painted:
+            self.painted = True
+            # Queued, so listeners run after this frame has been flushed to the screen
+            QTimer.singleShot(0, self.first_painted.emit)
 
     def init_ui(self):
         layout = QVBoxLayout(self)
@@ -42,6 +170,9 @@ class CalendarView(QWidget):
         self.prev_btn = QPushButton('‹')
         self.next_btn = QPushButton('›')
         self.today_btn = QPushButton('Today')
+        self.mode_btn = QPushButton('Bars')
+        self.mode_btn.setCheckable(True)
+        self.mode_btn.setToolTip('Draw multi-day events as continuous bars')
         self.month_label = QLabel()
         self.month_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
@@ -49,18 +180,63 @@ class CalendarView(QWidget):
         self.header.addWidget(self.month_label, 1)
         self.header.addWidget(self.next_btn)
         self.header.addWidget(self.today_btn)
+        self.header.addWidget(self.mode_btn)
 
         layout.addLayout(self.header)
-        self.grid = QGridLayout()
+        self.pages = QStackedWidget()
+        layout.addWidget(self.pages, 1)
+        self.cell_page = QWidget()
+        self.grid = QGridLayout(self.cell_page)
         self.grid.setContentsMargins(2, 2, 2, 2)  # (Optional: compactness)
-        layout.addLayout(self.grid)
+        self.grid.setVerticalSpacing(2)  # Reduce space between header and top row
+        self.pages.addWidget(self.cell_page)
+
+        # Header row (Sun-Sat)
+        calendar.setfirstweekday(calendar.SUNDAY)
+        days = list(calendar.day_abbr)
+        days = days[-1:] + days[:-1]
+        for i, day in enumerate(days):
+            label = QLabel(day)
+            label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            # Fixed height so the header row doesn't take extra space
+            label.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
+            self.grid.addWidget(label, 0, i)
+        self.grid.setRowStretch(0, 0)
+
+        # The 6x7 day cells are created once and reused for every month
+        self.cells = []
+        for i in range(42):
+            cell = DayCell()
+            cell.day_label.clicked.connect(self.on_day_cell_clicked)
+            cell.more_label.clicked.connect(lambda _=None, c=cell: self.show_day_events_dialog(c.date, c.events))
+            self.grid.addWidget(cell, 1 + i // 7, i % 7)
+            self.cells.append(cell)
 
         self.prev_btn.clicked.connect(self.go_prev)
         self.next_btn.clicked.connect(self.go_next)
         self.today_btn.clicked.connect(self.go_today)
+        self.mode_btn.setChecked(self.mode == MODE_PAINTED)
+        self.mode_btn.toggled.connect(lambda checked: self.set_mode(MODE_PAINTED if checked else MODE_CELLS))
+        self.show_mode_page()
 
         self.setLayout(layout)
 
+    def set_mode(self, mode):
+        if mode == self.mode:
+            return
+        self.mode = mode
+        set_setting("calendar/mode", mode)
+        self.show_mode_page()
+        self.refresh()
+
+    def show_mode_page(self):
+        if self.mode == MODE_PAINTED and self.month_grid is None:
+            self.month_grid = MonthGridWidget()
+            self.month_grid.day_clicked.connect(self.on_day_cell_clicked)
+            self.month_grid.more_clicked.connect(self.show_day_events_dialog)
+            self.pages.addWidget(self.month_grid)
+        self.pages.setCurrentWidget(self.month_grid if self.mode == MODE_PAINTED else self.cell_page)
+
     def go_prev(self):
         prev_month = self.current_date.month - 1 or 12
         prev_year = self.current_date.year - (1 if self.current_date.month == 1 else 0)
@@ -78,138 +254,57 @@ class CalendarView(QWidget):
         self.refresh()
 
     def refresh(self):
-        calendar.setfirstweekday(calendar.SUNDAY)
-        while self.grid.count():
-            widget = self.grid.takeAt(0).widget()
-            if widget:
-                widget.deleteLater()
-        # Header row (Sun-Sat)
-        days = list(calendar.day_abbr)
-        days = days[-1:] + days[:-1]
-        for i, day in enumerate(days):
-            label = QLabel(day)
-            label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.grid.addWidget(label, 0, i)
-            # Set the grid layout's row stretch to 0 to prevent extra space
-            self.grid.setRowStretch(0, 0)
-            # Set size policy to ensure the label doesn't expand unnecessarily
-            label.setSizePolicy(
-                QSizePolicy.Policy.Preferred,  # Horizontal policy
-                QSizePolicy.Policy.Fixed  # Vertical policy - fixed height
-            )
-
-        self.grid.setVerticalSpacing(2)  # Reduce space between header and top row
         year, month = self.current_date.year, self.current_date.month
         self.month_label.setText(self.current_date.strftime("%B %Y"))
+        layout = self.layouts.get(year, month)
+        today = self.today.date()
+        if self.mode == MODE_PAINTED:
+            self.month_grid.set_month_layout(layout, today)
+        else:
+            for i, cell in enumerate(self.cells):
+                cell_date = datetime.combine(layout.day(i), datetime.min.time())
+                cell.set_day(cell_date, layout.day_events[i], cell_date.month == month, cell_date.date() == today)
+        self.prefetch_queue = adjacent_months(year, month)
+        self.prefetch_timer.start()
+
+    def prefetch_next(self):
+        while self.prefetch_queue:
+            year, month = self.prefetch_queue.pop(0)
+            if self.layouts.prefetch(year, month):
+                break
+        if self.prefetch_queue:
+            self.prefetch_timer.start()
 
-        first_weekday, days_in_month = calendar.monthrange(year, month)
+    def visible_range(self):
+        """First and last datetime shown in the 6x7 grid (Sunday-first)."""
+        first_weekday, _ = calendar.monthrange(self.current_date.year, self.current_date.month)
         offset = (first_weekday + 1) % 7
         grid_start = self.current_date - timedelta(days=offset)
-        for week in range(1, 7):
-            for day in range(7):
-                cell_date = grid_start + timedelta(days=(week - 1) * 7 + day)
-                events = self.get_events_for_date(cell_date)
-                is_current_month = cell_date.month == month
-                self.add_day_cell(cell_date, week, day, events, is_current_month)
-
-    def add_day_cell(self, date, row, col, events, is_current_month):
-        cell = QFrame()
-        cell.setFrameShape(QFrame.Shape.StyledPanel)
-        cell_layout = QVBoxLayout(cell)
-        cell_layout.setContentsMargins(2, 2, 2, 2)
-        cell_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        # cell.setStyleSheet(f"background: rgb(111,11,211); ")
-        # day_label = QLabel(str(date.day))
-        day_label = ClickableDayLabel(date)
-        day_label.clicked.connect(self.on_day_cell_clicked)
-        # day_label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignHCenter)
-        day_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        if not is_current_month:
-            day_label.setStyleSheet("color: #aaa;")
-        if date.date() == self.today.date():
-            # Set fixed size to make it a perfect circle
-            size = 20  # Diameter in pixels
-            day_label.setFixedSize(size, size)
-
-            # Style with white circle background - more explicit styling
-            day_label.setStyleSheet("""
-                                background-color: #a8c7fa;
-                                /* border: 1px solid white; */
-                                border-radius: 10px;  /* Half the diameter */
-                                color: black;
-                                font-weight: bold;
-                                padding: 0px;
-                                margin: 0px;
-                            """)
-
-        # Create horizontal layout for the first label to center it
-        h_layout = QtWidgets.QHBoxLayout()
-        h_layout.addStretch(1)
-        h_layout.addWidget(day_label)
-        h_layout.addStretch(1)
-        h_layout.setContentsMargins(0, 0, 0, 0)
-
-        # Add the horizontal layout to the cell's vertical layout
-        cell_layout.addLayout(h_layout)
-        # cell_layout.addWidget(h_layout)
-
-        visible = 4
-        for i, ev in enumerate(events[:visible]):
-            start = parse_date(ev.start_date).date()
-            end = parse_date(ev.end_date).date()
-            cur = date.date()
-
-            ev_label = QLabel(ev.description)
-            r, g, b = ev.chip
-            # ev_label.setStyleSheet(
-            #     f"background: rgb({r},{g},{b}); color: #fff; border-radius: 5px; padding:1px 2px; font-size:11px; ")
-            ev_label.setStyleSheet(
-                f"background: rgb({r},{g},{b}); color: #fff; padding:1px 2px; font-size:11px; ")
-            if cur == start:
-                ev_label.setStyleSheet(ev_label.styleSheet() +
-                                       f"border-top-left-radius: 5px; border-bottom-left-radius: 5px; ")
-            if cur == end:
-                ev_label.setStyleSheet(ev_label.styleSheet() +
-                                       f"border-top-right-radius: 5px; border-bottom-right-radius: 5px; ")
-
-            ev_label.setToolTip(f"{ev.description}\n{ev.start_date} – {ev.end_date}")
-            ev_label.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Minimum)
-            cell_layout.addWidget(ev_label)
-        if len(events) > visible:
-            more = len(events) - visible
-            more_label = ClickableLabel(f"+{more} more")
-            more_label.setStyleSheet("color: #999; font-size:10px; text-decoration: underline;")
-            more_label.setCursor(Qt.CursorShape.PointingHandCursor)
-            more_label.clicked.connect(lambda _=None, d=date, evs=events: self.show_day_events_dialog(d, evs))
-            cell_layout.addWidget(more_label)
-        cell.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Minimum)
-        self.grid.addWidget(cell, row, col)
+        return grid_start, grid_start + timedelta(days=41)
 
     def show_day_events_dialog(self, date, events):
         dlg = DayEventsDialog(date, events, self)
         dlg.exec()
 
     def get_events_for_date(self, date):
-        result = []
-        for e in self.events:
-            start = parse_date(e.start_date)
-            end = parse_date(e.end_date)
-            if start.date() <= date.date() <= end.date():
-                result.append(e)
-        result.sort(key=lambda e: (parse_date(e.start_date), e.description))
-        return result
+        return self.event_store.events_on(date)
 
-    def on_day_cell_clicked(self, dt):
-        # Print all events whose date range contains dt
-        matches = []
+    def on_events_changed(self, ids, previous=()):
+        """Redraw only if a changed event (old or new version) touches what is on screen."""
+        affected = [e for e in (self.event_store.get(i) for i in ids) if e is not None] + list(previous)
+        self.layouts.invalidate(affected)
+        selected = self.selected_date.date() if self.selected_date else None
+        if selected and any(e.start_date <= selected <= e.end_date for e in affected):
+            # Keep the map's highlight in step with the edited events
+            self.select_day_events = self.event_store.events_on(self.selected_date)
+            self.day_clicked.emit(self.select_day_events)
+        grid_first, grid_last = self.visible_range()
+        if any(e.start_date <= grid_last.date() and e.end_date >= grid_first.date() for e in affected):
+            self.refresh()
 
-        for e in self.events:
-            start = datetime.strptime(e.start_date, "%m/%d/%Y").date() if isinstance(e.start_date,
-                                                                                              str) else e.start_date
-            end = datetime.strptime(e.end_date, "%m/%d/%Y").date() if isinstance(e.end_date,
-                                                                                          str) else e.end_date
-            if start <= dt.date() <= end:
-                matches.append(e)
+    def on_day_cell_clicked(self, dt):
+        # All events whose date range contains dt
+        matches = self.event_store.events_on(dt)
 
         # for ev in matches:
         #     print(f"- {ev.description} ({ev.start_date} to {ev.end_date})")
@@ -218,6 +313,7 @@ class CalendarView(QWidget):
         if matches == self.select_day_events:
             matches = []
 
+        self.selected_date = dt if matches else None
         self.select_day_events = matches
         self.day_clicked.emit(matches)
         self.refresh()
\ No newline at end of file
@@ -1,6 +1,5 @@
 from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel
 from PyQt6.QtCore import Qt
-from utils.date_utils import parse_date
 
 LEFT_BORDER = "border-top-left-radius: 5px; border-bottom-left-radius: 5px; "
 RIGHT_BORDER = "border-top-right-radius: 5px; border-bottom-right-radius: 5px; "
@@ -21,16 +20,14 @@ class DayEventsDialog(QDialog):
         layout.addWidget(num_lbl)
         # Events
         for event in events:
-            start = parse_date(event.start_date).date()
-            end = parse_date(event.end_date).date()
             day = day_date.date()
             r, g, b = event.chip
             label = QLabel(event.description)
             label.setStyleSheet(
                 f"background: rgb({r},{g},{b}); color: #fff; padding:2px 4px; font-size:12px;")
-            if day == start:
+            if day == event.start_date:
                 label.setStyleSheet(label.styleSheet() + LEFT_BORDER)
-            if day == end:
+            if day == event.end_date:
                 label.setStyleSheet(label.styleSheet() + RIGHT_BORDER)
 
             layout.addWidget(label)
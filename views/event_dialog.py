@@ -2,7 +2,6 @@ from PyQt6.QtWidgets import QDialog, QFormLayout, QLineEdit, QDateEdit, QDialogB
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor
 from models.event_model import Event
-from utils.date_utils import parse_date, format_date
 from datetime import datetime
 
 GOOGLE_EVENT_COLORS = [
@@ -54,10 +53,8 @@ class EventDialog(QDialog):
         self.end = QDateEdit()
         self.end.setCalendarPopup(True)
         if self.event:
-            s = parse_date(self.event.start_date)
-            e = parse_date(self.event.end_date)
-            self.start.setDate(s.date())
-            self.end.setDate(e.date())
+            self.start.setDate(self.event.start_date)
+            self.end.setDate(self.event.end_date)
             self.chip_color = QColor(*self.event.chip)
         else:
             today = datetime.today().date()
@@ -98,7 +95,8 @@ class EventDialog(QDialog):
             self.city.text(),
             self.indep.isChecked(),
             self.visited.isChecked(),
-            self.start.date().toString("M/d/yyyy"),
-            self.end.date().toString("M/d/yyyy"),
-            list(self.chip_color.getRgb()[:3])
+            self.start.date().toPyDate(),
+            self.end.date().toPyDate(),
+            list(self.chip_color.getRgb()[:3]),
+            id=self.event.id if self.event else None
         )
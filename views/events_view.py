@@ -1,22 +1,35 @@
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QListWidget, QPushButton, QHBoxLayout, QListWidgetItem,
+    QWidget, QVBoxLayout, QListView, QPushButton, QHBoxLayout,
     QMessageBox, QLineEdit, QLabel
 )
-from PyQt6.QtCore import pyqtSignal
-from PyQt6.QtGui import QColor
+from PyQt6.QtCore import Qt, QTimer
+from models.event_list_model import EventListModel, EventFilterProxyModel, EventIdRole
+from models.event_search import QueryError
 from views.event_dialog import EventDialog
-from models.event_model import Event
+
+FILTER_DEBOUNCE_MS = 150
 
 class EventsView(QWidget):
-    event_edited = pyqtSignal()
-    def __init__(self, events, event_repo, parent=None):
+    def __init__(self, event_store, parent=None):
         super().__init__(parent)
         self.resize(200, 400)
-        self.events = events
-        self.event_repo = event_repo
+        self.event_store = event_store
+        self.events = event_store.events
         self.filter_text = ""
+        # The model follows the store's change signals; the proxy filters and sorts
+        self.model = EventListModel(event_store, self)
+        self.proxy = EventFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.sort(0, Qt.SortOrder.AscendingOrder)
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self.filter_timer.timeout.connect(self.apply_filter)
         self.init_ui()
-        self.refresh()
+        # Re-run an active search so ranks and matches cover edited events
+        event_store.events_added.connect(self.on_events_changed)
+        event_store.events_updated.connect(self.on_events_changed)
+        event_store.events_removed.connect(self.on_events_changed)
 
     def init_ui(self):
         self.setWindowTitle('Events')
@@ -25,13 +38,17 @@ class EventsView(QWidget):
         filter_row = QHBoxLayout()
         filter_label = QLabel("Filter:")
         self.filter_box = QLineEdit()
+        self.filter_box.setPlaceholderText("county:franklin visited:no june")
         filter_row.addWidget(filter_label)
         filter_row.addWidget(self.filter_box, 1)
         layout.addLayout(filter_row)
         self.filter_box.textChanged.connect(self.on_filter_changed)
         # Event list
-        self.list = QListWidget()
-        self.list.itemDoubleClicked.connect(self.edit_event)
+        self.list = QListView()
+        self.list.setModel(self.proxy)
+        self.list.setUniformItemSizes(True)
+        self.list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.list.doubleClicked.connect(self.edit_event)
         layout.addWidget(self.list)
         # Add/Delete buttons
         btn_layout = QHBoxLayout()
@@ -46,62 +63,41 @@ class EventsView(QWidget):
 
     def on_filter_changed(self, text):
         self.filter_text = text
-        self.refresh()
+        self.filter_timer.start()
+
+    def apply_filter(self):
+        try:
+            matches = self.event_store.search(self.filter_text)
+            self.filter_box.setToolTip("")
+        except QueryError as e:
+            matches = []
+            self.filter_box.setToolTip(str(e))
+        self.proxy.set_matches(matches)
+
+    def on_events_changed(self, *_):
+        if self.filter_text.strip():
+            self.apply_filter()
 
-    def refresh(self):
-        self.list.clear()
-        # Sort events by description (case-insensitive)
-        filtered = [
-            ev for ev in self.events
-            if self.filter_text.strip().lower() in ev.description.lower()
-        ]
-        for ev in sorted(filtered, key=lambda e: e.description.lower()):
-            item = QListWidgetItem(f"{ev.description}")
-            r, g, b = ev.chip
-            item.setBackground(QColor(r, g, b))
-            self.list.addItem(item)
+    def event_for_index(self, index):
+        return self.event_store.get(index.data(EventIdRole)) if index.isValid() else None
 
     def add_event(self):
         dialog = EventDialog(parent=self)
         if dialog.exec():
-            new_event = dialog.get_event()
-            self.events.append(new_event)
-            self.event_repo.save_events(self.events)
-            self.refresh()
-            self.event_edited.emit()
+            self.event_store.add(dialog.get_event())
 
-    def edit_event(self, item):
-        idx = self.list.row(item)
-        filtered = [
-            ev for ev in self.events
-            if self.filter_text.strip().lower() in ev.description.lower()
-        ]
-        sorted_filtered = sorted(filtered, key=lambda e: e.description.lower())
-        ev = sorted_filtered[idx]
-        orig_idx = self.events.index(ev)
+    def edit_event(self, index):
+        ev = self.event_for_index(index)
+        if ev is None:
+            return
         dialog = EventDialog(ev, parent=self)
         if dialog.exec():
-            self.events[orig_idx] = dialog.get_event()
-            self.event_repo.save_events(self.events)
-            self.refresh()
-            self.event_edited.emit()
+            self.event_store.update(dialog.get_event())
 
     def delete_event(self):
-        idx = self.list.currentRow()
-        if idx < 0:
-            return
-        filtered = [
-            ev for ev in self.events
-            if self.filter_text.strip().lower() in ev.description.lower()
-        ]
-        sorted_filtered = sorted(filtered, key=lambda e: e.description.lower())
-        if idx >= len(sorted_filtered):
+        ev = self.event_for_index(self.list.currentIndex())
+        if ev is None:
             return
-        ev = sorted_filtered[idx]
-        orig_idx = self.events.index(ev)
         confirm = QMessageBox.question(self, "Delete Event", "Delete this event?")
         if confirm == QMessageBox.StandardButton.Yes:
-            del self.events[orig_idx]
-            self.event_repo.save_events(self.events)
-            self.refresh()
-            self.event_edited.emit()
+            self.event_store.remove(ev.id)
@@ -0,0 +1,341 @@
+import math
+from PyQt6.QtWidgets import (
+    QGraphicsView, QGraphicsScene, QGraphicsItem, QGraphicsPathItem, QGraphicsRectItem, QGraphicsSimpleTextItem
+)
+from PyQt6.QtCore import Qt, QTimer, QPointF, QRectF, pyqtSignal
+from PyQt6.QtGui import QPainter, QPainterPath, QPolygonF, QPen, QBrush, QColor, QFont, QTransform
+from models.gazetteer import load_gazetteer
+from utils.label_placer import LabelPlacer
+from views.map_render_worker import MapBuildTask
+from views.map_window import MapWindow
+from views.map_pins import (
+    COUNTY_SEAT_KEYS, NEUTRAL, INTERSTATE_STYLE, US_ROUTE_STYLE, PIN_LABEL_OFFSET_PT,
+    LABEL_TIER_EVENT_CITY, LABEL_TIER_COUNTY_SEAT, LABEL_TIER_COUNTY,
+    pin_style, pin_tooltip, seat_places, group_by_place, apply_event_changes
+)
+
+NEUTRAL_COLOR = QColor.fromRgbF(*NEUTRAL)
+LABEL_PLACEMENT_DELAY_MS = 60
+ZOOM_STEP = 1.2
+MAX_ZOOM_FACTOR = 64
+
+
+def rings_path(rings):
+    """QPainterPath for a set of rings; odd-even filling leaves holes empty whatever their winding."""
+    path = QPainterPath()
+    path.setFillRule(Qt.FillRule.OddEvenFill)
+    for coords in rings:
+        if len(coords) < 3:
+            continue
+        # Scene y grows downwards, so north is flipped up
+        path.addPolygon(QPolygonF([QPointF(x, -y) for x, y in coords]))
+    return path
+
+
+def lines_path(lines):
+    path = QPainterPath()
+    for coords in lines:
+        if len(coords) < 2:
+            continue
+        path.moveTo(coords[0][0], -coords[0][1])
+        for x, y in coords[1:]:
+            path.lineTo(x, -y)
+    return path
+
+
+def marker_path(marker, size_px):
+    """Pixel-space QPainterPath for the matplotlib marker codes used by pin_style."""
+    r = size_px / 2
+    path = QPainterPath()
+    if marker == "*":
+        points = []
+        for k in range(10):
+            radius = r if k % 2 == 0 else r * 0.4
+            angle = math.pi / 2 + k * math.pi / 5
+            points.append(QPointF(radius * math.cos(angle), -radius * math.sin(angle)))
+        path.addPolygon(QPolygonF(points))
+        path.closeSubpath()
+    elif marker in ("P", "X"):
+        t = r / 3
+        cross = [(-t, -r), (t, -r), (t, -t), (r, -t), (r, t), (t, t), (t, r), (-t, r), (-t, t), (-r, t), (-r, -t), (-t, -t)]
+        path.addPolygon(QPolygonF([QPointF(x, y) for x, y in cross]))
+        path.closeSubpath()
+        if marker == "X":
+            path = QTransform().rotate(45).map(path)
+    else:
+        path.addEllipse(QPointF(0, 0), r, r)
+    return path
+
+
+class GraphicsMapData:
+    """Draw buffers for the QGraphicsScene backend, built off the GUI thread."""
+
+    def __init__(self, county_names, county_label_xy, county_paths, road_paths, gazetteer):
+        self.county_names = county_names
+        self.county_label_xy = county_label_xy
+        self.county_paths = county_paths  # one QPainterPath per county
+        self.road_paths = road_paths      # [(QPainterPath, is_interstate)]
+        self.gazetteer = gazetteer
+
+
+class GraphicsMapBuildTask(MapBuildTask):
+    """Same loading pipeline as MapView's worker, producing QPainterPaths instead of matplotlib paths."""
+
+    def prepare(self, bundle, still_current):
+        county_paths = []
+        for c in range(bundle.county_count):
+            county_paths.append(rings_path(coords for coords, _ in bundle.county_rings(c)))
+            if not still_current():
+                return None
+        road_paths = []
+        for is_interstate in (False, True):
+            lines = [bundle.road(i) for i in range(bundle.road_count) if bundle.road_is_interstate[i] == is_interstate]
+            if lines:
+                road_paths.append((lines_path(lines), is_interstate))
+        return GraphicsMapData([str(name) for name in bundle.county_names], bundle.county_label_xy,
+                               county_paths, road_paths, load_gazetteer())
+
+
+class MapGraphicsView(QGraphicsView):
+    """Drag to pan, wheel to zoom around the cursor; emits view_changed whenever the visible area moves."""
+    view_changed = pyqtSignal()
+
+    def __init__(self, scene, parent=None):
+        super().__init__(scene, parent)
+        self.setRenderHints(QPainter.RenderHint.Antialiasing | QPainter.RenderHint.TextAntialiasing)
+        self.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
+        self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setBackgroundBrush(QBrush(Qt.GlobalColor.white))
+        self.fit_scale = None
+
+    def fit(self, rect):
+        self.resetTransform()
+        self.fitInView(rect, Qt.AspectRatioMode.KeepAspectRatio)
+        self.fit_scale = self.transform().m11()
+        self.view_changed.emit()
+
+    def wheelEvent(self, event):
+        factor = ZOOM_STEP ** (event.angleDelta().y() / 120)
+        current = self.transform().m11()
+        if self.fit_scale is not None:
+            # Don't zoom out past the whole state or in beyond street level
+            target = min(max(current * factor, self.fit_scale * 0.8), self.fit_scale * MAX_ZOOM_FACTOR)
+            factor = target / current
+        self.scale(factor, factor)
+        self.view_changed.emit()
+
+    def scrollContentsBy(self, dx, dy):
+        super().scrollContentsBy(dx, dy)
+        self.view_changed.emit()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.view_changed.emit()
+
+
+class GraphicsMapView(MapWindow):
+    """QGraphicsScene map backend: a drop-in for MapView selected with the map/backend setting."""
+
+    def __init__(self, event_store, parent=None):
+        super().__init__(event_store, parent)
+        self.scene = QGraphicsScene(self)
+        # The default BSP index answers hover and tooltip hit-tests
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+        self.view = MapGraphicsView(self.scene)
+        self.set_map_widget(self.view)
+
+        self.data = None
+        self.county_items = []
+        self.county_index = {}
+        self.county_labels = []
+        self.seat_labels = {}
+        self.road_items = []
+        self.city_pins = {}
+        self.label_placer = LabelPlacer()
+        self.label_timer = QTimer(self)
+        self.label_timer.setSingleShot(True)
+        self.label_timer.setInterval(LABEL_PLACEMENT_DELAY_MS)
+        self.label_timer.timeout.connect(self.place_labels)
+        self.view.view_changed.connect(self.label_timer.start)
+        self.request_map()
+
+    def redraw_highlights(self):
+        colors = [NEUTRAL_COLOR] * len(self.county_items)
+        for e in self.selected_events:
+            idx = self.county_index.get(e.county.strip().upper())
+            # A county with several events keeps the first event's chip
+            if idx is None or colors[idx] is not NEUTRAL_COLOR:
+                continue
+            colors[idx] = QColor(*e.chip)
+        for item, color in zip(self.county_items, colors):
+            if item.brush().color() != color:
+                item.setBrush(QBrush(color))
+
+    def set_show_roads(self, show):
+        super().set_show_roads(show)
+        for item in self.road_items:
+            item.setVisible(show)
+
+    def create_build_task(self, generation):
+        return GraphicsMapBuildTask(generation, self.is_current_build)
+
+    def show_map(self, data):
+        self.data = data
+        self.build_items()
+        # Fit once the view has its final size
+        QTimer.singleShot(0, lambda: self.view.fit(self.counties_rect))
+
+    def build_items(self):
+        """Create every scene item once; highlights and pins are then updated in place."""
+        self.scene.clear()
+        data = self.data
+        self.county_index = {name: i for i, name in enumerate(data.county_names)}
+        border = QPen(QColor("black"), 0.8)
+        border.setCosmetic(True)
+        self.county_items = []
+        for path in data.county_paths:
+            item = QGraphicsPathItem(path)
+            item.setPen(border)
+            item.setBrush(QBrush(NEUTRAL_COLOR))
+            # Panning reuses each county's cached pixmap instead of re-tessellating the path
+            item.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+            item.setZValue(1)
+            self.scene.addItem(item)
+            self.county_items.append(item)
+        self.counties_rect = self.scene.itemsBoundingRect()
+
+        self.road_items = []
+        for path, is_interstate in data.road_paths:
+            color, width = INTERSTATE_STYLE if is_interstate else US_ROUTE_STYLE
+            pen = QPen(QColor(color), width)
+            pen.setCosmetic(True)
+            pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+            item = self.scene.addPath(path, pen)
+            item.setZValue(5)
+            item.setVisible(self.show_roads)
+            self.road_items.append(item)
+
+        self.county_labels = []
+        for name, (label_x, label_y) in zip(data.county_names, data.county_label_xy):
+            label = self.make_label(name.title(), QPointF(label_x, -label_y), "#333", 0.7, centered=True)
+            label.setZValue(10)
+            self.county_labels.append(label)
+
+        self.gazetteer = data.gazetteer
+        self.seat_labels = {}
+        for place_idx, seat in seat_places(self.gazetteer).items():
+            seat_x, seat_y = self.gazetteer.xy(place_idx)
+            label = self.make_label(seat.title(), QPointF(seat_x, -seat_y), "#222", 0.5, centered=True)
+            label.setZValue(10)
+            self.seat_labels[place_idx] = label
+        self.place_events = group_by_place(self.events, self.place_of)
+        self.city_pins = {}
+        self.update_pins(list(self.place_events))
+        self.redraw_highlights()
+
+    def make_label(self, text, anchor, color, alpha, centered=False, offset_px=0.0):
+        """A boxed, zoom-independent text label anchored at a scene point."""
+        text_item = QGraphicsSimpleTextItem(text)
+        font = QFont()
+        font.setPointSizeF(7)
+        text_item.setFont(font)
+        text_item.setBrush(QBrush(QColor(color)))
+        rect = text_item.boundingRect().adjusted(-2, -1, 2, 1)
+        box = QGraphicsRectItem(rect)
+        box.setPen(QPen(Qt.PenStyle.NoPen))
+        fill = QColor("white")
+        fill.setAlphaF(alpha)
+        box.setBrush(QBrush(fill))
+        text_item.setParentItem(box)
+        box.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIgnoresTransformations)
+        box.setPos(anchor)
+        dx = -rect.width() / 2 if centered else offset_px
+        box.setTransform(QTransform.fromTranslate(dx - rect.left(), -rect.height() / 2 - rect.top()))
+        self.scene.addItem(box)
+        return box
+
+    def on_events_changed(self, ids, previous=()):
+        """Rebuild only the pins whose events were added, edited or removed."""
+        if self.gazetteer is None:
+            return  # build_items reads the store directly once the map arrives
+        touched = apply_event_changes(self.place_events, self.event_store, self.place_of, ids, previous)
+        if touched:
+            self.update_pins(touched)
+
+    def update_pins(self, places):
+        for place_idx in places:
+            old = self.city_pins.pop(place_idx, None)
+            if old is not None:
+                for item in old["items"]:
+                    self.scene.removeItem(item)
+            evlist = self.place_events.get(place_idx)
+            if evlist:
+                self.city_pins[place_idx] = self.make_pin(place_idx, evlist)
+        self.label_timer.start()
+
+    def make_pin(self, place_idx, evlist):
+        city = evlist[0].city.strip().upper()
+        x, y = self.gazetteer.xy(place_idx)
+        is_capital = self.gazetteer.place_keys[place_idx] in COUNTY_SEAT_KEYS
+        marker, size, pin_color = pin_style(evlist, is_capital)
+        size_px = size * self.logicalDpiX() / 72
+
+        item = QGraphicsPathItem(marker_path(marker, size_px))
+        item.setBrush(QBrush(QColor(pin_color)))
+        outline = QPen(QColor("white"), 1)
+        outline.setCosmetic(True)
+        item.setPen(outline)
+        item.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIgnoresTransformations)
+        item.setPos(x, -y)
+        item.setZValue(99)
+        # QGraphicsView finds the hovered item through the scene index and shows this natively
+        item.setToolTip(pin_tooltip(city, evlist))
+        self.scene.addItem(item)
+        label = self.make_label(city.title(), QPointF(x, -y), "#222", 0.5,
+                                offset_px=PIN_LABEL_OFFSET_PT * self.logicalDpiX() / 72)
+        label.setZValue(100)
+        return {
+            "item": item,
+            "items": [item, label],
+            "label": label,
+            "size_px": size_px,
+            "is_seat": is_capital,
+            "city": city,
+            "x": x, "y": y,
+            "events": evlist,
+        }
+
+    def place_labels(self):
+        """Show only labels that fit: event cities, then county seats without events, then county names."""
+        if self.data is None:
+            return
+        viewport = QRectF(self.view.viewport().rect())
+        self.label_placer.clear()
+        candidates = []
+        for pin in self.city_pins.values():
+            p = QPointF(self.view.mapFromScene(QPointF(pin["x"], -pin["y"])))
+            half = pin["size_px"] / 2
+            if viewport.contains(p):
+                self.label_placer.occupy((p.x() - half, p.y() - half, p.x() + half, p.y() + half))
+            # Every pin is an event city; being a county seat only breaks ties between equally busy ones
+            candidates.append(((LABEL_TIER_EVENT_CITY, -len(pin["events"]), not pin["is_seat"]), pin["label"]))
+        for place_idx, label in self.seat_labels.items():
+            if place_idx in self.city_pins:
+                label.setVisible(False)  # a seat with events already has its pin label
+            else:
+                candidates.append(((LABEL_TIER_COUNTY_SEAT, 0), label))
+        for label in self.county_labels:
+            candidates.append(((LABEL_TIER_COUNTY, 0), label))
+        candidates.sort(key=lambda c: c[0])
+
+        transform = self.view.viewportTransform()
+        for _, label in candidates:
+            # deviceTransform folds in the label's own pixel offset from its anchor
+            rect = label.deviceTransform(transform).mapRect(label.boundingRect())
+            if not viewport.intersects(rect):
+                label.setVisible(False)
+                continue
+            label.setVisible(self.label_placer.try_place((rect.left(), rect.top(), rect.right(), rect.bottom())))
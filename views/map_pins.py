@@ -0,0 +1,93 @@
+"""Pin bookkeeping and the map styles shared by both map backends and the tile renderer."""
+from models.gazetteer import normalize_place_name
+
+# OHIO_COUNTY_SEATS = {
+#     "ADAMS": "WEST UNION", "ALLEN": "LIMA", "ASHLAND": "ASHLAND", "ASHTABULA": "JEFFERSON",
+#     # ... (rest of county seats as in previous code) ...
+#     "WYANDOT": "UPPER SANDUSKY"
+# }
+
+OHIO_COUNTY_SEATS = {
+    "FRANKLIN": "COLUMBUS"
+}
+
+COUNTY_SEAT_KEYS = {normalize_place_name(seat) for seat in OHIO_COUNTY_SEATS.values()}
+
+VISITED_COLOR = "#28a745"
+UNVISITED_COLOR = "#d32f2f"
+NEUTRAL = (220/255, 220/255, 220/255)  # county fill, as RGB fractions
+INTERSTATE_STYLE = ("#1f4e9c", 1.6)    # (color, line width in points)
+US_ROUTE_STYLE = ("#b5651d", 1.0)
+PIN_LABEL_OFFSET_PT = 5
+# Label placement order: lower tiers claim screen space first
+LABEL_TIER_EVENT_CITY = 0
+LABEL_TIER_COUNTY_SEAT = 1  # seats without events; a seat with a pin ranks as an event city
+LABEL_TIER_COUNTY = 2
+
+
+def pin_style(evlist, is_capital):
+    """(marker, size in points, color) for a pin, using matplotlib marker codes."""
+    pin_color = VISITED_COLOR if all(ev.visited for ev in evlist) else UNVISITED_COLOR
+
+    # marker = "*" if is_capital else "o"
+    # size = 11 if is_capital else 6
+    # matplotlib markers = P: plus, D: diamond, p: pentagon
+    is_independent = any(ev.independent == True for ev in evlist)
+    marker = "*" if is_capital else ("P" if is_independent else "o")
+    size = 11 if is_capital else (7 if is_independent else 6)
+
+    is_visited = any(ev.visited == True for ev in evlist)
+    if is_visited:
+        marker = "X"
+        size = 7
+    return marker, size, pin_color
+
+
+def pin_tooltip(city, evlist):
+    event_text = f"{city.title()}\n\n"
+    for ev in evlist:
+        event_text += f"{ev.description}\n{ev.date_range_text()}\nVisited: {'Yes' if ev.visited else 'No'}\n\n"
+    return event_text.strip()
+
+
+def seat_places(gazetteer):
+    """{place index: seat name} for the county seats the gazetteer can place."""
+    places = {}
+    for county, seat in OHIO_COUNTY_SEATS.items():
+        place_idx = gazetteer.resolve(seat, county)
+        if place_idx is not None:
+            places[place_idx] = seat
+    return places
+
+
+def group_by_place(events, place_of):
+    """{place index: [events]} for every event whose city resolves."""
+    place_events = {}
+    for e in events:
+        place_idx = place_of(e)
+        if place_idx is not None:
+            place_events.setdefault(place_idx, []).append(e)
+    return place_events
+
+
+def apply_event_changes(place_events, event_store, place_of, ids, previous=()):
+    """Fold a store change into ``place_events`` in place; returns the touched place indices."""
+    touched = set()
+    for old in previous:
+        place_idx = place_of(old)
+        if place_idx is None:
+            continue
+        evlist = [e for e in place_events.get(place_idx, []) if e.id != old.id]
+        if evlist:
+            place_events[place_idx] = evlist
+        else:
+            place_events.pop(place_idx, None)
+        touched.add(place_idx)
+    for event_id in ids:
+        ev = event_store.get(event_id)
+        place_idx = place_of(ev) if ev is not None else None
+        if place_idx is None:
+            continue
+        place_events.setdefault(place_idx, []).append(ev)
+        touched.add(place_idx)
+    return touched
@@ -0,0 +1,128 @@
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+import numpy as np
+from models.map_bundle import load_map_bundle
+from models.gazetteer import load_gazetteer
+from views.map_tiles import ensure_map_tiles
+
+
+def _signed_area(coords):
+    x, y = coords[:, 0], coords[:, 1]
+    return 0.5 * float(np.dot(x[:-1], y[1:]) - np.dot(x[1:], y[:-1]))
+
+
+def county_path(bundle, county_idx, level=0):
+    """One compound Path per county; holes are wound opposite to exteriors so they stay empty."""
+    # Imported here so the QGraphicsView backend can share this worker without matplotlib
+    from matplotlib.path import Path
+
+    vertices, codes = [], []
+    for coords, is_hole in bundle.county_rings(county_idx, level):
+        if len(coords) < 3:
+            continue
+        if (_signed_area(coords) > 0) == is_hole:
+            coords = coords[::-1]
+        ring_codes = np.full(len(coords), Path.LINETO, dtype=Path.code_type)
+        ring_codes[0] = Path.MOVETO
+        ring_codes[-1] = Path.CLOSEPOLY
+        vertices.append(coords)
+        codes.append(ring_codes)
+    if not vertices:
+        return Path(np.empty((0, 2)))
+    return Path(np.concatenate(vertices), np.concatenate(codes))
+
+
+class MapScene:
+    """Ready-to-draw buffers: everything the GUI thread needs except the artists themselves."""
+
+    def __init__(self, bundle, county_paths, gazetteer):
+        self.bundle = bundle
+        self.county_names = [str(name) for name in bundle.county_names]
+        self.county_label_xy = bundle.county_label_xy
+        self.county_bbox = bundle.county_bbox
+        self.lod_tolerances = bundle.lod_tolerances
+        self.county_paths = county_paths  # county_paths[level][county]
+        self.road_is_interstate = bundle.road_is_interstate
+        self.road_segments = [[bundle.road(i, level) for i in range(bundle.road_count)]
+                              for level in range(bundle.lod_count)]
+        self.gazetteer = gazetteer
+        self.tile_grid = None       # TileGrid when the map is drawn from the offline tile pyramid
+        self.tiles_have_roads = False
+
+    @property
+    def extent(self):
+        """(xmin, ymin, xmax, ymax) of the whole map."""
+        bbox = self.county_bbox
+        return bbox[:, 0].min(), bbox[:, 1].min(), bbox[:, 2].max(), bbox[:, 3].max()
+
+    def level_for(self, units_per_pixel):
+        """Coarsest level whose simplification error stays under about half a pixel."""
+        level = 0
+        for i, tolerance in enumerate(self.lod_tolerances):
+            if tolerance <= units_per_pixel * 0.5:
+                level = i
+        return level
+
+    def visible_counties(self, xlim, ylim):
+        """Indices of the counties whose bounding box overlaps the view."""
+        bbox = self.county_bbox
+        x0, x1 = sorted(xlim)
+        y0, y1 = sorted(ylim)
+        mask = (bbox[:, 2] >= x0) & (bbox[:, 0] <= x1) & (bbox[:, 3] >= y0) & (bbox[:, 1] <= y1)
+        return np.flatnonzero(mask)
+
+
+def build_scene(bundle, gazetteer=None, is_current=None):
+    """County paths for every level of detail; None if ``is_current()`` turns False midway."""
+    county_paths = []
+    for level in range(bundle.lod_count):
+        county_paths.append([county_path(bundle, i, level) for i in range(bundle.county_count)])
+        if is_current is not None and not is_current():
+            return None
+    return MapScene(bundle, county_paths, gazetteer)
+
+
+class MapBuildSignals(QObject):
+    finished = pyqtSignal(int, object)  # generation, MapScene
+    failed = pyqtSignal(int, str)
+
+
+class MapBuildTask(QRunnable):
+    """Load the map bundle and prepare county paths on a QThreadPool thread.
+
+    `is_current(generation)` is polled between steps so a superseded build stops early;
+    results are delivered through queued signals and never touch matplotlib artists.
+    """
+
+    def __init__(self, generation, is_current, tiles=False):
+        super().__init__()
+        self.generation = generation
+        self.is_current = is_current
+        self.tiles = tiles
+        self.signals = MapBuildSignals()
+
+    def run(self):
+        try:
+            bundle = load_map_bundle()
+            if not self.is_current(self.generation):
+                return
+            scene = self.prepare(bundle, lambda: self.is_current(self.generation))
+            if scene is None:
+                return
+        except Exception as exc:
+            self.signals.failed.emit(self.generation, str(exc))
+            return
+        if self.is_current(self.generation):
+            self.signals.finished.emit(self.generation, scene)
+
+    def prepare(self, bundle, still_current):
+        """Turn the bundle into the backend's draw buffers; None if superseded midway."""
+        scene = build_scene(bundle, is_current=still_current)
+        if scene is None:
+            return None
+        scene.gazetteer = load_gazetteer()
+        if self.tiles:
+            # Renders the pyramid (in a child process) only when the TIGER inputs changed since the last build
+            scene.tile_grid, scene.tiles_have_roads = ensure_map_tiles(is_current=still_current)
+            if scene.tile_grid is None:
+                return None
+        return scene
@@ -0,0 +1,285 @@
+"""Offline z/x/y PNG tile pyramid of the static base map, and the layer that composites it.
+
+Tiles live in the map's own coordinates (degrees, as drawn by MapView): zoom ``z``
+splits a square around Ohio into ``2**z`` by ``2**z`` tiles, row 0 at the top.
+The app renders the pyramid in a child process (tools.build_map_tiles): matplotlib
+is not thread-safe, and the GUI thread's canvas may be drawing at the same time.
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+
+from models.map_bundle import BUNDLE_VERSION
+from models.map_geometry import CACHE_DIR, ROOT_DIR, TIGER_DIR, source_fingerprint
+from utils.label_placer import LabelPlacer, TextExtentCache
+from views.map_pins import NEUTRAL, INTERSTATE_STYLE, US_ROUTE_STYLE
+
+TILE_DIR = os.path.join(CACHE_DIR, "tiles")
+TILE_SIZE = 256
+TILE_DPI = 100
+MAX_ZOOM = 4
+TILE_VERSION = 1
+TILE_CACHE_SIZE = 128
+TILE_BUILD_POLL_S = 0.2
+
+
+class TileGrid:
+    def __init__(self, left, top, span, max_zoom=MAX_ZOOM, tile_size=TILE_SIZE):
+        self.left = left
+        self.top = top
+        self.span = span
+        self.max_zoom = max_zoom
+        self.tile_size = tile_size
+
+    @classmethod
+    def for_extent(cls, extent, max_zoom=MAX_ZOOM, tile_size=TILE_SIZE):
+        xmin, ymin, xmax, ymax = extent
+        span = max(xmax - xmin, ymax - ymin) * 1.04
+        cx, cy = (xmin + xmax) / 2, (ymin + ymax) / 2
+        return cls(cx - span / 2, cy + span / 2, span, max_zoom, tile_size)
+
+    def to_dict(self):
+        return {"left": self.left, "top": self.top, "span": self.span,
+                "max_zoom": self.max_zoom, "tile_size": self.tile_size}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["left"], data["top"], data["span"], data["max_zoom"], data["tile_size"])
+
+    def tile_span(self, z):
+        return self.span / (1 << z)
+
+    def bounds(self, z, x, y):
+        """(x0, y0, x1, y1) of tile (z, x, y) in map units."""
+        step = self.tile_span(z)
+        x0 = self.left + x * step
+        y1 = self.top - y * step
+        return x0, y1 - step, x0 + step, y1
+
+    def zoom_for(self, units_per_pixel):
+        """Shallowest zoom whose tiles are at least as sharp as the screen."""
+        for z in range(self.max_zoom + 1):
+            if self.tile_span(z) / self.tile_size <= units_per_pixel:
+                return z
+        return self.max_zoom
+
+    def tiles_in(self, z, xlim, ylim):
+        step = self.tile_span(z)
+        n = 1 << z
+        x0, x1 = sorted(xlim)
+        y0, y1 = sorted(ylim)
+        cols = range(max(0, int((x0 - self.left) // step)), min(n, int((x1 - self.left) // step) + 1))
+        rows = range(max(0, int((self.top - y1) // step)), min(n, int((self.top - y0) // step) + 1))
+        return [(z, x, y) for y in rows for x in cols]
+
+
+def tile_path(root, z, x, y):
+    return os.path.join(root, str(z), str(x), f"{y}.png")
+
+
+def tiles_fingerprint(tiger_dir=TIGER_DIR, roads=False, max_zoom=MAX_ZOOM):
+    return json.loads(json.dumps({
+        "version": TILE_VERSION, "bundle": BUNDLE_VERSION, "roads": roads, "max_zoom": max_zoom,
+        "sources": source_fingerprint(tiger_dir),
+    }))
+
+
+def read_manifest(root=TILE_DIR):
+    try:
+        with open(os.path.join(root, "manifest.json"), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _manifest_is_current(manifest, tiger_dir, roads, max_zoom):
+    if manifest is None:
+        return False
+    stored = manifest.get("fingerprint", {})
+    if roads is None:
+        roads = stored.get("roads", False)
+    expected = tiles_fingerprint(tiger_dir, roads, max_zoom)
+    if all(size is None for _, _, size in expected["sources"]):
+        # Shipped without the TIGER sources: trust the tiles like the bundle is trusted
+        expected["sources"] = stored.get("sources")
+    return stored == expected
+
+
+def build_map_tiles(scene, out_dir=TILE_DIR, max_zoom=MAX_ZOOM, roads=False, tiger_dir=TIGER_DIR):
+    """Render county fills, borders, names and (optionally) roads into a tile pyramid.
+
+    Tiles are written to a private temp directory next to ``out_dir`` and swapped
+    in at the end, so a half-written pyramid is never picked up. Returns the TileGrid.
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.collections import LineCollection, PathCollection
+
+    grid = TileGrid.for_extent(scene.extent, max_zoom)
+    fig = Figure(figsize=(TILE_SIZE / TILE_DPI, TILE_SIZE / TILE_DPI), dpi=TILE_DPI)
+    fig.patch.set_alpha(0.0)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_axes([0, 0, 1, 1])
+    ax.axis("off")
+    counties = PathCollection([], facecolors=[(*NEUTRAL, 1.0)], edgecolors="black", linewidths=0.8, zorder=1)
+    ax.add_collection(counties)
+    road_lines = None
+    if roads:
+        road_styles = [INTERSTATE_STYLE if i else US_ROUTE_STYLE for i in scene.road_is_interstate]
+        road_lines = LineCollection([], colors=[c for c, _ in road_styles], linewidths=[w for _, w in road_styles],
+                                    capstyle="round", zorder=5)
+        ax.add_collection(road_lines)
+    labels = []
+    for name, (label_x, label_y) in zip(scene.county_names, scene.county_label_xy):
+        labels.append(ax.text(
+            label_x, label_y, name.title(), fontsize=7, ha="center", va="center", color="#333",
+            bbox=dict(boxstyle="round,pad=0.2", fc="white", ec="none", alpha=0.7), zorder=10))
+    extents = TextExtentCache()
+    renderer = canvas.get_renderer()
+    # Bigger counties keep their names first when labels collide
+    bbox = scene.county_bbox
+    label_order = np.argsort(-(bbox[:, 2] - bbox[:, 0]) * (bbox[:, 3] - bbox[:, 1]))
+
+    parent = os.path.dirname(os.path.abspath(out_dir))
+    os.makedirs(parent, exist_ok=True)
+    # Each build gets its own directory, so concurrent or aborted builds never share files
+    tmp_dir = tempfile.mkdtemp(dir=parent, prefix=".tiles-")
+    try:
+        for z in range(max_zoom + 1):
+            units_per_pixel = grid.tile_span(z) / TILE_SIZE
+            level = scene.level_for(units_per_pixel)
+            paths = scene.county_paths[level]
+            if road_lines is not None:
+                road_lines.set_segments(scene.road_segments[level])
+            # Place labels once per zoom in pyramid-wide pixels so they agree across tile edges
+            placer = LabelPlacer()
+            placed = np.zeros(len(labels), dtype=bool)
+            for i in label_order:
+                w, h = extents.size(labels[i], renderer, TILE_DPI)
+                px = (scene.county_label_xy[i][0] - grid.left) / units_per_pixel
+                py = (grid.top - scene.county_label_xy[i][1]) / units_per_pixel
+                placed[i] = placer.try_place((px - w / 2, py - h / 2, px + w / 2, py + h / 2))
+            # Labels can spill into a neighbouring tile by up to half their width
+            margin = max(max(extents.size(label, renderer, TILE_DPI)) for label in labels) * units_per_pixel
+            n = 1 << z
+            for x in range(n):
+                for y in range(n):
+                    x0, y0, x1, y1 = grid.bounds(z, x, y)
+                    visible = scene.visible_counties((x0, x1), (y0, y1))
+                    if not len(visible):
+                        continue  # nothing but background; the compositor treats a missing tile as empty
+                    # Only hand Agg the counties and labels that can touch this tile
+                    counties.set_paths([paths[i] for i in visible])
+                    counties.set_facecolor([(*NEUTRAL, 1.0)] * len(visible))
+                    label_x, label_y = scene.county_label_xy[:, 0], scene.county_label_xy[:, 1]
+                    near = ((label_x >= x0 - margin) & (label_x <= x1 + margin)
+                            & (label_y >= y0 - margin) & (label_y <= y1 + margin))
+                    for label, show in zip(labels, placed & near):
+                        label.set_visible(bool(show))
+                    ax.set_xlim(x0, x1)
+                    ax.set_ylim(y0, y1)
+                    path = tile_path(tmp_dir, z, x, y)
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    canvas.print_png(path)
+
+        with open(os.path.join(tmp_dir, "manifest.json"), "w", encoding="utf-8") as f:
+            json.dump({"fingerprint": tiles_fingerprint(tiger_dir, roads, max_zoom), "grid": grid.to_dict()}, f)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    shutil.rmtree(out_dir, ignore_errors=True)
+    os.replace(tmp_dir, out_dir)
+    return grid
+
+
+def ensure_map_tiles(out_dir=TILE_DIR, max_zoom=MAX_ZOOM, roads=None, tiger_dir=TIGER_DIR, is_current=None):
+    """Return (grid, roads_baked) for an up-to-date pyramid, rendering it only if the inputs changed.
+
+    ``roads=None`` accepts whichever variant is on disk and renders without roads
+    when a rebuild is needed. The grid is None if the build was superseded.
+    """
+    manifest = read_manifest(out_dir)
+    if _manifest_is_current(manifest, tiger_dir, roads, max_zoom):
+        return TileGrid.from_dict(manifest["grid"]), manifest["fingerprint"]["roads"]
+    roads = bool(roads)
+    return render_tiles_in_subprocess(out_dir, max_zoom, roads, tiger_dir, is_current), roads
+
+
+def render_tiles_in_subprocess(out_dir=TILE_DIR, max_zoom=MAX_ZOOM, roads=False, tiger_dir=TIGER_DIR,
+                               is_current=None):
+    """Run tools.build_map_tiles in a child process and wait for it off the GUI thread.
+
+    The child is stopped as soon as ``is_current()`` turns False; returns the
+    TileGrid, or None for a superseded build.
+    """
+    cmd = [sys.executable, "-m", "tools.build_map_tiles", tiger_dir, "-o", out_dir, "--max-zoom", str(max_zoom)]
+    if roads:
+        cmd.append("--roads")
+    # stderr goes to a file rather than a pipe, so a chatty child can't block on a full buffer
+    with tempfile.TemporaryFile("w+", encoding="utf-8") as err:
+        proc = subprocess.Popen(cmd, cwd=ROOT_DIR, stdout=subprocess.DEVNULL, stderr=err)
+        while True:
+            try:
+                proc.wait(timeout=TILE_BUILD_POLL_S)
+                break
+            except subprocess.TimeoutExpired:
+                if is_current is not None and not is_current():
+                    proc.terminate()
+                    proc.wait()
+                    return None
+        if proc.returncode != 0:
+            err.seek(0)
+            lines = err.read().strip().splitlines()
+            raise RuntimeError(f"tile build failed: {lines[-1] if lines else f'exit status {proc.returncode}'}")
+    manifest = read_manifest(out_dir)
+    if manifest is None:
+        raise RuntimeError(f"tile build wrote no manifest to {out_dir}")
+    return TileGrid.from_dict(manifest["grid"])
+
+
+class TileLayer:
+    """Keeps one AxesImage per visible tile and swaps them as the view moves."""
+
+    def __init__(self, ax, grid, root=TILE_DIR):
+        self.ax = ax
+        self.grid = grid
+        self.root = root
+        self.images = {}
+        self.pixels = OrderedDict()  # LRU of decoded tiles; None marks a tile that was never rendered
+
+    def _load(self, key):
+        if key in self.pixels:
+            self.pixels.move_to_end(key)
+            return self.pixels[key]
+        import matplotlib.image as mpimg
+
+        path = tile_path(self.root, *key)
+        pixels = mpimg.imread(path) if os.path.exists(path) else None
+        self.pixels[key] = pixels
+        if len(self.pixels) > TILE_CACHE_SIZE:
+            self.pixels.popitem(last=False)
+        return pixels
+
+    def update(self, xlim, ylim, units_per_pixel):
+        z = self.grid.zoom_for(units_per_pixel)
+        wanted = set(self.grid.tiles_in(z, xlim, ylim))
+        for key in [key for key in self.images if key not in wanted]:
+            self.images.pop(key).remove()
+        for key in wanted - self.images.keys():
+            pixels = self._load(key)
+            if pixels is None:
+                continue
+            x0, y0, x1, y1 = self.grid.bounds(*key)
+            self.images[key] = self.ax.imshow(pixels, extent=(x0, x1, y0, y1), origin="upper",
+                                              interpolation="bilinear", zorder=0)
+
+    def clear(self):
+        for image in self.images.values():
+            image.remove()
+        self.images.clear()
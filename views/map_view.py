@@ -1,244 +1,411 @@
-import os
-import geopandas as gpd
 import matplotlib
 matplotlib.use("Qt5Agg")
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QToolTip
-from PyQt6.QtCore import Qt
-from matplotlib.path import Path
-from matplotlib.patches import PathPatch
+from PyQt6.QtWidgets import QToolTip, QPushButton
+from PyQt6.QtCore import QTimer
+from matplotlib.collections import PathCollection, LineCollection
 from matplotlib.colors import LinearSegmentedColormap
 from PyQt6.QtGui import QCursor
 import numpy as np
-import re
 from datetime import datetime
+from utils.spatial_index import GridIndex
+from utils.label_placer import LabelPlacer, TextExtentCache
+from utils.settings import get_setting, set_setting
+from views.map_tiles import TileLayer
+from views.map_render_worker import MapBuildTask
+from views.map_window import MapWindow
+from views.map_pins import (
+    COUNTY_SEAT_KEYS, NEUTRAL, INTERSTATE_STYLE, US_ROUTE_STYLE, PIN_LABEL_OFFSET_PT,
+    LABEL_TIER_EVENT_CITY, LABEL_TIER_COUNTY_SEAT, LABEL_TIER_COUNTY,
+    pin_style, pin_tooltip, seat_places, group_by_place, apply_event_changes
+)
 
-# OHIO_COUNTY_SEATS = {
-#     "ADAMS": "WEST UNION", "ALLEN": "LIMA", "ASHLAND": "ASHLAND", "ASHTABULA": "JEFFERSON",
-#     # ... (rest of county seats as in previous code) ...
-#     "WYANDOT": "UPPER SANDUSKY"
-# }
+NAVIGATION_SETTLE_MS = 150
+PIN_HOVER_RADIUS_PX = 12
+MODE_VECTOR = "vector"
+MODE_TILES = "tiles"
+TILE_HIGHLIGHT_ALPHA = 0.75
 
-OHIO_COUNTY_SEATS = {
-    "FRANKLIN": "COLUMBUS"
-}
 
-class MapView(QWidget):
-    def __init__(self, events, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Map")
-        self.resize(800, 800)
-        self.events = events
-
-        layout = QVBoxLayout(self)
+class MapView(MapWindow):
+    def __init__(self, event_store, parent=None):
+        super().__init__(event_store, parent)
+        self.mode = get_setting("map/mode", MODE_VECTOR)
+        self.tiles_btn = QPushButton('Tiles')
+        self.tiles_btn.setCheckable(True)
+        self.tiles_btn.setChecked(self.mode == MODE_TILES)
+        self.tiles_btn.setToolTip('Draw the base map from pre-rendered tiles')
+        self.tiles_btn.toggled.connect(lambda checked: self.set_mode(MODE_TILES if checked else MODE_VECTOR))
+        self.add_header_button(self.tiles_btn)
         self.fig, self.ax = plt.subplots()
         self.canvas = FigureCanvas(self.fig)
-        layout.addWidget(self.canvas)
-        self.setLayout(layout)
+        self.set_map_widget(self.canvas)
         self.ax.set_aspect("equal")
         self.fig.subplots_adjust(left=0.04, right=0.98, top=0.97, bottom=0.03)
 
-        self.selected_events = []
+        self.scene = None
+        self.county_collection = None
+        self.road_collection = None
+        self.tile_layer = None
+        self.county_index = {}
+        self.county_highlighted = np.zeros(0, dtype=bool)
+        self.county_facecolors = np.empty((0, 4))
+        self.county_labels = []
+        self.seat_labels = {}
+        self.label_placer = LabelPlacer()
+        self.text_extents = TextExtentCache()
+        self.lod_level = None
+        self.visible_counties = np.empty(0, dtype=int)
+        self.city_pins = {}
         self.city_pin_artists = []
         self.city_pin_data = []
+        self.pin_index = GridIndex([])
+        self.hover_pin = None
         self.press_event = None
         self.orig_xlim = None
         self.orig_ylim = None
-        self.plot_map()
+        self.pan_offset = (0, 0)
+        self.pan_background = None
+        self.viewport_dirty = False
+        self.settle_timer = QTimer(self)
+        self.settle_timer.setSingleShot(True)
+        self.settle_timer.setInterval(NAVIGATION_SETTLE_MS)
+        self.settle_timer.timeout.connect(self.finish_navigation)
+        self.request_map()
 
         self.canvas.mpl_connect("button_press_event", self.on_press)
         self.canvas.mpl_connect("button_release_event", self.on_release)
         self.canvas.mpl_connect("motion_notify_event", self.on_motion)
         self.canvas.mpl_connect("scroll_event", self.on_scroll)
+        self.canvas.mpl_connect("resize_event", self.update_viewport)
         # Remove pick event; use hover for tooltip
         self.canvas.mpl_connect("motion_notify_event", self.on_motion_hover)
 
-    def highlight_date(self, events):
-        """Update map for selected date (datetime.date)."""
-        for ev in events:
-            print(f"- {ev.description} ({ev.start_date} to {ev.end_date})")
-        self.selected_events = events
-        print("plot_map")
+    def redraw_highlights(self):
+        if self.apply_highlights():
+            self.canvas.draw_idle()
+
+    def apply_highlights(self):
+        """Recolor the highlighted counties in place; returns True if any color changed."""
+        facecolors = np.empty_like(self.county_facecolors)
+        # Tiles carry the neutral fill; in tile mode only the highlighted counties are drawn on top
+        facecolors[:] = (*NEUTRAL, 1.0 if self.tile_layer is None else TILE_HIGHLIGHT_ALPHA)
+        highlighted = set()
+        for e in self.selected_events:
+            idx = self.county_index.get(e.county.strip().upper())
+            # A county with several events keeps the first event's chip
+            if idx is None or idx in highlighted:
+                continue
+            facecolors[idx, :3] = np.array(e.chip) / 255.0
+            highlighted.add(idx)
+
+        if np.array_equal(facecolors, self.county_facecolors):
+            return False
+        self.county_facecolors = facecolors
+        self.county_highlighted = np.zeros(len(facecolors), dtype=bool)
+        self.county_highlighted[list(highlighted)] = True
+        self.update_viewport(force=True)
+        return True
+
+    def update_viewport(self, *_args, force=False):
+        """Pick the level of detail for the current zoom and drop counties, labels and pins outside the view."""
+        if self.county_collection is None:
+            return
+        self.viewport_dirty = False
+        xlim, ylim = self.ax.get_xlim(), self.ax.get_ylim()
+        units_per_pixel = abs(xlim[1] - xlim[0]) / max(self.ax.bbox.width, 1.0)
+        level = self.scene.level_for(units_per_pixel)
+        visible = self.scene.visible_counties(xlim, ylim)
+        if self.tile_layer is not None:
+            self.tile_layer.update(xlim, ylim, units_per_pixel)
+            visible = visible[self.county_highlighted[visible]]
+        if force or level != self.lod_level or not np.array_equal(visible, self.visible_counties):
+            self.lod_level = level
+            self.visible_counties = visible
+            paths = self.scene.county_paths[level]
+            self.county_collection.set_paths([paths[i] for i in visible])
+            self.county_collection.set_facecolor(self.county_facecolors[visible])
+            self.road_collection.set_segments(self.scene.road_segments[level])
+        x0, x1 = sorted(xlim)
+        y0, y1 = sorted(ylim)
+        for pin in self.city_pin_data:
+            pin["artist"].set_visible(bool(x0 <= pin["x"] <= x1 and y0 <= pin["y"] <= y1))
+        self.place_labels()
+
+    def place_labels(self):
+        """Show only labels that fit: event cities, then county seats without events, then county names."""
+        renderer = self.canvas.get_renderer()
+        dpi = self.fig.dpi
+        to_px = self.ax.transData.transform
+        view = self.ax.bbox
+        self.label_placer.clear()
+
+        candidates = []
+        visible_pins = [pin for pin in self.city_pin_data if pin["artist"].get_visible()]
+        for pin in visible_pins:
+            px, py = to_px((pin["x"], pin["y"]))
+            half = pin["marker_size"] * dpi / 72 / 2
+            self.label_placer.occupy((px - half, py - half, px + half, py + half))
+            w, h = self.text_extents.size(pin["label"], renderer, dpi)
+            left = px + PIN_LABEL_OFFSET_PT * dpi / 72
+            # Every pin is an event city; being a county seat only breaks ties between equally busy ones
+            rank = (LABEL_TIER_EVENT_CITY, -len(pin["events"]), not pin["is_seat"])
+            candidates.append((rank, (left, py - h / 2, left + w, py + h / 2), pin["label"]))
+        for label in self.county_labels:
+            label.set_visible(False)
+        # In tile mode the county names are baked into the tiles
+        for i in (self.visible_counties if self.tile_layer is None else ()):
+            label = self.county_labels[i]
+            px, py = to_px(self.scene.county_label_xy[i])
+            if not view.contains(px, py):
+                continue
+            w, h = self.text_extents.size(label, renderer, dpi)
+            candidates.append(((LABEL_TIER_COUNTY, 0), (px - w / 2, py - h / 2, px + w / 2, py + h / 2), label))
+        for place_idx, label in self.seat_labels.items():
+            label.set_visible(False)
+            px, py = to_px(label.get_position())
+            # A seat with events already has its pin label
+            if place_idx in self.city_pins or not view.contains(px, py):
+                continue
+            w, h = self.text_extents.size(label, renderer, dpi)
+            candidates.append(((LABEL_TIER_COUNTY_SEAT, 0), (px - w / 2, py - h / 2, px + w / 2, py + h / 2), label))
+        for pin in self.city_pin_data:
+            pin["label"].set_visible(False)
+
+        candidates.sort(key=lambda c: c[0])
+        for _, rect, label in candidates:
+            label.set_visible(self.label_placer.try_place(rect))
+
+    def set_show_roads(self, show):
+        super().set_show_roads(show)
+        if self.road_collection is not None:
+            self.road_collection.set_visible(self.roads_overlay_visible())
+            self.canvas.draw_idle()
+
+    def roads_overlay_visible(self):
+        # Tiles rendered with --roads already show them underneath
+        return self.show_roads and not (self.tile_layer is not None and self.scene.tiles_have_roads)
+
+    def set_mode(self, mode):
+        if mode == self.mode:
+            return
+        self.mode = mode
+        set_setting("map/mode", mode)
+        self.request_map()
+
+    def create_build_task(self, generation):
+        return MapBuildTask(generation, self.is_current_build, tiles=self.mode == MODE_TILES)
+
+    def show_map(self, scene):
+        self.scene = scene
         self.plot_map()
 
     def plot_map(self):
+        """Build every map artist once from the prepared scene; later updates go through apply_highlights."""
+        # Switching modes rebuilds the scene; keep the user's view across it
+        previous_view = (self.ax.get_xlim(), self.ax.get_ylim()) if self.county_collection is not None else None
         self.ax.clear()
-        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        tiger_dir = os.path.join(root, "TIGER")
-        gdf_counties = gpd.read_file(os.path.join(tiger_dir, "cb_2024_us_county_500k.shp"))
-        ohio_counties = gdf_counties[gdf_counties["STATEFP"] == "39"]
-        ohio_boundary = ohio_counties.unary_union
-        NEUTRAL = (220/255, 220/255, 220/255)
-        # selected_dt = self.selected_date
-        county_event_map = {}
-        for e in self.selected_events:
-            county = e.county.strip().upper()
-            if county not in county_event_map:
-                county_event_map[county] = []
-            county_event_map[county].append(e.chip)
-
-        for _, row in ohio_counties.iterrows():
-            county_name = row["NAME"].upper()
-            geom = row["geometry"]
-            chip = county_event_map.get(county_name, None)
-            polygons = []
-            if geom.geom_type == "Polygon":
-                polygons = [geom]
-            elif geom.geom_type == "MultiPolygon":
-                polygons = list(geom.geoms)
-            else:
-                continue
-            for poly in polygons:
-                if chip:
-                    color = np.array(chip) / 255.0
-                    exterior_coords = np.array(poly.exterior.coords)
-                    path = Path(exterior_coords)
-                    patch = PathPatch(path, facecolor=color, edgecolor="black", linewidth=0.8, zorder=1)
-                    self.ax.add_patch(patch)
-                    for interior in poly.interiors:
-                        interior_coords = np.array(interior.coords)
-                        interior_path = Path(interior_coords)
-                        interior_patch = PathPatch(
-                            interior_path,
-                            facecolor="white", edgecolor="black", linewidth=0.8, zorder=1)
-                        self.ax.add_patch(interior_patch)
-                else:
-                    exterior_coords = np.array(poly.exterior.coords)
-                    path = Path(exterior_coords)
-                    patch = PathPatch(path, facecolor=NEUTRAL, edgecolor="black", linewidth=0.8, zorder=1)
-                    self.ax.add_patch(patch)
-                    for interior in poly.interiors:
-                        interior_coords = np.array(interior.coords)
-                        interior_path = Path(interior_coords)
-                        interior_patch = PathPatch(
-                            interior_path,
-                            facecolor="white", edgecolor="black", linewidth=0.8, zorder=1)
-                        self.ax.add_patch(interior_patch)
-                exterior_coords = np.array(poly.exterior.coords)
-                self.ax.plot(exterior_coords[:, 0], exterior_coords[:, 1], color="black", linewidth=0.8, zorder=2)
-            centroid = row["geometry"].centroid
-            self.ax.text(
-                centroid.x, centroid.y, row["NAME"].title(), fontsize=7, ha="center", va="center", color="#333",
+        scene = self.scene
+        self.tile_layer = TileLayer(self.ax, scene.tile_grid) if scene.tile_grid is not None else None
+        self.county_index = {name: i for i, name in enumerate(scene.county_names)}
+        self.county_facecolors = np.tile((*NEUTRAL, 1.0), (len(scene.county_names), 1))
+        self.county_highlighted = np.zeros(len(scene.county_names), dtype=bool)
+        self.lod_level = None
+        self.county_collection = PathCollection(
+            [], facecolors=self.county_facecolors, edgecolors="black", linewidths=0.8, zorder=1)
+        self.ax.add_collection(self.county_collection)
+        # Roads sit above the county fill and below labels and pins, as one artist
+        road_styles = [INTERSTATE_STYLE if i else US_ROUTE_STYLE for i in scene.road_is_interstate]
+        self.road_collection = LineCollection(
+            [], colors=[c for c, _ in road_styles], linewidths=[w for _, w in road_styles],
+            capstyle="round", zorder=5, visible=self.roads_overlay_visible())
+        self.ax.add_collection(self.road_collection)
+        xmin, ymin, xmax, ymax = scene.extent
+        pad_x, pad_y = (xmax - xmin) * 0.02, (ymax - ymin) * 0.02
+        self.ax.set_xlim(xmin - pad_x, xmax + pad_x)
+        self.ax.set_ylim(ymin - pad_y, ymax + pad_y)
+        if previous_view is not None:
+            self.ax.set_xlim(previous_view[0])
+            self.ax.set_ylim(previous_view[1])
+        self.county_labels = []
+        for i, county_name in enumerate(scene.county_names):
+            label_x, label_y = scene.county_label_xy[i]
+            label = self.ax.text(
+                label_x, label_y, county_name.title(), fontsize=7, ha="center", va="center", color="#333",
                 bbox=dict(boxstyle="round,pad=0.2", fc="white", ec="none", alpha=0.7), zorder=10
             )
+            self.county_labels.append(label)
 
-        # Cities -- only inside Ohio
-        places_gdf = gpd.read_file(os.path.join(tiger_dir, "tl_2024_39_place.shp"))
-        ohio_cities = places_gdf[places_gdf.intersects(ohio_boundary)]
-        event_cities = {e.city.strip().upper(): [] for e in self.events}
-        for e in self.events:
-            event_cities[e.city.strip().upper()].append(e)
-
-        city_name_map = {}
-        for _, row in ohio_cities.iterrows():
-            # format raw city name
-            raw_name = row["NAME"].upper()
-            raw_name = re.sub(r" \(.*\)", "", raw_name)
-            raw_name = re.sub(r"MOUNT ", "MT. ", raw_name)
-            for suffix in [" CITY", " VILLAGE", " TOWN", " ", " CORP", " CORPORATION"]:
-                if raw_name.endswith(suffix):
-                    raw_name = raw_name[: -len(suffix)]
-            city_name_map[raw_name] = row
-
-        self.city_pin_artists = []
-        self.city_pin_data = []
-        for county, seat in OHIO_COUNTY_SEATS.items():
-            OHIO_COUNTY_SEATS[county] = seat.upper()
-        for city, evlist in event_cities.items():
-            city_key = city
-            # Updating BARLOW and RANDOLPH for now to make pins visible
-            if city_key == "BARLOW":
-                city_key = "VINCENT"
-            if city_key == "RANDOLPH":
-                city_key = "RAVENNA"
-            found_row = None
-            for cand in [city_key, city_key.replace(" CITY", ""), city_key.replace(" VILLAGE", "")]:
-                if cand in city_name_map:
-                    found_row = city_name_map[cand]
-                    break
-            if found_row is None:
-                print(f"Warning - city not found: {city_key}")
-                continue
-            x, y = found_row["geometry"].centroid.xy
-            is_capital = any(seat == city_key for seat in OHIO_COUNTY_SEATS.values())
-            pin_color = "#28a745" if all(ev.visited for ev in evlist) else "#d32f2f"
-
-            # marker = "*" if is_capital else "o"
-            # size = 11 if is_capital else 6
-            # matplotlib markers = P: plus, D: diamond, p: pentagon
-            is_independent = any(ev.independent == True for ev in evlist)
-            marker = "*" if is_capital else ("P" if is_independent else "o")
-            size = 11 if is_capital else (7 if is_independent else 6)
-
-            is_visited = any(ev.visited == True for ev in evlist)
-            if is_visited:
-                marker = "X"
-                size = 7
-
-            artist = self.ax.plot(x[0], y[0], marker=marker, color=pin_color, markersize=size,
-                                  markeredgecolor="white", zorder=99)[0]  # <-- zorder high
-            self.city_pin_artists.append(artist)
-            # City label right of pin | + 0.0275
-            self.ax.text(
-                x[0]+7000, y[0], city.title(), fontsize=7, ha="left", va="center", color="#222",
-                bbox=dict(boxstyle="round,pad=0.1", fc="white", ec="none", alpha=0.5), zorder=100
+        # Cities -- only inside Ohio (already filtered when the bundle was built)
+        self.gazetteer = scene.gazetteer
+        self.seat_labels = {}
+        for place_idx, seat in seat_places(self.gazetteer).items():
+            seat_x, seat_y = self.gazetteer.xy(place_idx)
+            self.seat_labels[place_idx] = self.ax.text(
+                seat_x, seat_y, seat.title(), fontsize=7, ha="center", va="center", color="#222",
+                bbox=dict(boxstyle="round,pad=0.1", fc="white", ec="none", alpha=0.5), zorder=10, visible=False
             )
-            event_text = ""
-            for ev in evlist:
-                event_text += f"{ev.description}\n{ev.start_date} – {ev.end_date}\n"
-            self.city_pin_data.append({
-                "artist": artist,
-                "city": city,
-                "x": x[0], "y": y[0],
-                "events": evlist,
-                "info": event_text
-            })
+        self.place_events = group_by_place(self.events, self.place_of)
+        self.city_pins = {}
+        self.update_pins(list(self.place_events))
 
         self.ax.set_xticks([])
         self.ax.set_yticks([])
         self.ax.set_frame_on(False)
         self.ax.set_title("")
         self.ax.axis("off")
+        self.apply_highlights()
+        self.update_viewport(force=True)
         self.canvas.draw()
 
+    def on_events_changed(self, ids, previous=()):
+        """Rebuild only the pins whose events were added, edited or removed."""
+        if self.gazetteer is None:
+            return  # plot_map reads the store directly once the map arrives
+        touched = apply_event_changes(self.place_events, self.event_store, self.place_of, ids, previous)
+        if touched:
+            self.update_pins(touched)
+            self.update_viewport()
+            self.canvas.draw_idle()
+
+    def update_pins(self, places):
+        for place_idx in places:
+            old = self.city_pins.pop(place_idx, None)
+            if old is not None:
+                for artist in old["artists"]:
+                    artist.remove()
+            evlist = self.place_events.get(place_idx)
+            if evlist:
+                self.city_pins[place_idx] = self.make_pin(place_idx, evlist)
+        self.city_pin_data = list(self.city_pins.values())
+        self.city_pin_artists = [d["artist"] for d in self.city_pin_data]
+        self.pin_index = GridIndex([(d["x"], d["y"]) for d in self.city_pin_data])
+        self.hover_pin = None
+
+    def make_pin(self, place_idx, evlist):
+        city = evlist[0].city.strip().upper()
+        x, y = self.gazetteer.xy(place_idx)
+        is_capital = self.gazetteer.place_keys[place_idx] in COUNTY_SEAT_KEYS
+        marker, size, pin_color = pin_style(evlist, is_capital)
+        artist = self.ax.plot(x, y, marker=marker, color=pin_color, markersize=size,
+                              markeredgecolor="white", zorder=99)[0]  # <-- zorder high
+        # City label a fixed screen distance right of the pin, whatever the zoom
+        label = self.ax.annotate(
+            city.title(), xy=(x, y), xytext=(PIN_LABEL_OFFSET_PT, 0), textcoords="offset points",
+            fontsize=7, ha="left", va="center", color="#222",
+            bbox=dict(boxstyle="round,pad=0.1", fc="white", ec="none", alpha=0.5), zorder=100
+        )
+        return {
+            "artist": artist,
+            "artists": [artist, label],
+            "label": label,
+            "marker_size": size,
+            "is_seat": is_capital,
+            "city": city,
+            "x": x, "y": y,
+            "events": evlist,
+            "info": pin_tooltip(city, evlist)
+        }
+
     def on_motion_hover(self, event):
+        if self.press_event is not None:
+            return
         if not event.inaxes or event.x is None or event.y is None:
+            self.hover_pin = None
+            QToolTip.hideText()
+            return
+        # Convert the pixel hit radius to data units, then ask the index for the closest pin
+        x0, x1 = self.ax.get_xlim()
+        y0, y1 = self.ax.get_ylim()
+        radius_x = PIN_HOVER_RADIUS_PX * abs(x1 - x0) / self.ax.bbox.width
+        radius_y = PIN_HOVER_RADIUS_PX * abs(y1 - y0) / self.ax.bbox.height
+        hit = self.pin_index.nearest(event.xdata, event.ydata, radius_x, radius_y)
+        if hit is None:
+            self.hover_pin = None
             QToolTip.hideText()
             return
-        mouse_xy = np.array([event.x, event.y])  # mouse pixel position
-        for city_data in self.city_pin_data:
-            # Convert data coordinates to display/pixel coordinates
-            pin_disp = self.ax.transData.transform((city_data['x'], city_data['y']))
-            dist = np.linalg.norm(mouse_xy - pin_disp)
-            if dist < 12:  # Only trigger tooltip if mouse is within 12 pixels of pin
-                events = city_data['events']
-                info = f"{city_data['city'].title()}\n\n"
-                for ev in events:
-                    info += f"{ev.description}\n{ev.start_date} – {ev.end_date}\nVisited: {'Yes' if ev.visited else 'No'}\n\n"
-                QToolTip.showText(QCursor.pos(), info.strip(), self)
-                return
-        QToolTip.hideText()
-
-    # --- rest unchanged ---
+        if hit != self.hover_pin:
+            self.hover_pin = hit
+            QToolTip.showText(QCursor.pos(), self.city_pin_data[hit]["info"], self)
+
+    # --- navigation: drags blit a cached bitmap, full redraws happen once the gesture settles ---
     def on_press(self, event):
         if event.button == 1 and event.inaxes:
             self.press_event = event
+            self.pan_offset = (0, 0)
             self.orig_xlim = self.ax.get_xlim()
             self.orig_ylim = self.ax.get_ylim()
+            QToolTip.hideText()
+            if self.canvas.supports_blit:
+                self.pan_background = self.canvas.copy_from_bbox(self.ax.bbox)
 
     def on_release(self, event):
+        if self.press_event is None:
+            return
+        self.settle_timer.stop()
+        self.apply_pan_limits()
         self.press_event = None
+        self.pan_background = None
+        self.canvas.draw_idle()
 
     def on_motion(self, event):
-        if self.press_event and event.inaxes:
-            dx = event.xdata - self.press_event.xdata
-            dy = event.ydata - self.press_event.ydata
-            x0, x1 = self.orig_xlim
-            y0, y1 = self.orig_ylim
-            self.ax.set_xlim(x0 - dx, x1 - dx)
-            self.ax.set_ylim(y0 - dy, y1 - dy)
+        if self.press_event is None or event.x is None or event.y is None:
+            return
+        self.pan_offset = (event.x - self.press_event.x, event.y - self.press_event.y)
+        if self.pan_background is None:
+            self.apply_pan_limits()
+            self.canvas.draw_idle()
+            return
+        self.blit_pan_background(*self.pan_offset)
+        self.settle_timer.start()
+
+    def apply_pan_limits(self):
+        dx_px, dy_px = self.pan_offset
+        x0, x1 = self.orig_xlim
+        y0, y1 = self.orig_ylim
+        dx = dx_px * (x1 - x0) / self.ax.bbox.width
+        dy = dy_px * (y1 - y0) / self.ax.bbox.height
+        self.set_view_limits((x0 - dx, x1 - dx), (y0 - dy, y1 - dy))
+
+    def set_view_limits(self, xlim, ylim, defer=False):
+        """Move the view and re-cull once for the new x and y limits together.
+
+        With ``defer`` the cull waits for finish_navigation, for wheel notches that aren't drawn.
+        """
+        self.ax.set_xlim(xlim)
+        self.ax.set_ylim(ylim)
+        if defer:
+            self.viewport_dirty = True
+        else:
+            self.update_viewport()
+
+    def blit_pan_background(self, dx_px, dy_px):
+        # Region extents are in Agg pixels with the origin at the top, hence the flipped dy
+        x1, y1, x2, y2 = self.pan_background.get_extents()
+        dx, dy = int(round(dx_px)), -int(round(dy_px))
+        src = (max(x1, x1 - dx), max(y1, y1 - dy), min(x2, x2 - dx), min(y2, y2 - dy))
+        self.ax.draw_artist(self.ax.patch)
+        if src[0] < src[2] and src[1] < src[3]:
+            self.canvas.restore_region(self.pan_background, bbox=src, xy=(x1 + dx, y1 + dy))
+        self.canvas.blit(self.ax.bbox)
+
+    def finish_navigation(self):
+        """Full-quality render once a drag pauses or a burst of wheel events ends."""
+        if self.press_event is None:
+            if self.viewport_dirty:
+                self.update_viewport()
             self.canvas.draw_idle()
+            return
+        # Mid-drag pause: render at the current offset and restart the drag from here
+        self.apply_pan_limits()
+        self.canvas.draw()
+        self.orig_xlim = self.ax.get_xlim()
+        self.orig_ylim = self.ax.get_ylim()
+        self.press_event.x += self.pan_offset[0]
+        self.press_event.y += self.pan_offset[1]
+        self.pan_offset = (0, 0)
+        self.pan_background = self.canvas.copy_from_bbox(self.ax.bbox)
 
     def on_scroll(self, event):
         if event.inaxes:
@@ -250,6 +417,10 @@ class MapView(QWidget):
             new_height = (cur_ylim[1] - cur_ylim[0]) * scale
             relx = (cur_xlim[1] - xdata) / (cur_xlim[1] - cur_xlim[0])
             rely = (cur_ylim[1] - ydata) / (cur_ylim[1] - cur_ylim[0])
-            self.ax.set_xlim([xdata - new_width * (1 - relx), xdata + new_width * relx])
-            self.ax.set_ylim([ydata - new_height * (1 - rely), ydata + new_height * rely])
-            self.canvas.draw_idle()
+            # Render the first notch right away, coalesce the rest of the burst into one redraw
+            in_burst = self.settle_timer.isActive()
+            self.set_view_limits([xdata - new_width * (1 - relx), xdata + new_width * relx],
+                                 [ydata - new_height * (1 - rely), ydata + new_height * rely], defer=in_burst)
+            if not in_burst:
+                self.canvas.draw_idle()
+            self.settle_timer.start()
@@ -0,0 +1,120 @@
+"""Window plumbing shared by MapView and GraphicsMapView: header, placeholder, build worker and store wiring."""
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QStackedWidget, QPushButton
+from PyQt6.QtCore import Qt, QThreadPool, pyqtSignal
+from utils.settings import get_flag, set_setting
+
+
+class MapWindow(QWidget):
+    """Base for the map backends.
+
+    Subclasses add their drawing widget with ``set_map_widget``, call ``request_map``
+    once their own state exists, and implement ``create_build_task``, ``show_map``,
+    ``redraw_highlights`` and ``on_events_changed``.
+    """
+    map_ready = pyqtSignal()
+
+    def __init__(self, event_store, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Map")
+        self.resize(800, 800)
+        self.event_store = event_store
+        self.events = event_store.events
+
+        layout = QVBoxLayout(self)
+        self.show_roads = get_flag("map/roads", False)
+        self.header = QHBoxLayout()
+        self.unmatched_label = QLabel()
+        self.unmatched_label.setStyleSheet("color: #b00020;")
+        self.unmatched_label.setVisible(False)
+        self.header.addWidget(self.unmatched_label)
+        self.header.addStretch()
+        self.roads_btn = QPushButton('Roads')
+        self.roads_btn.setCheckable(True)
+        self.roads_btn.setChecked(self.show_roads)
+        self.roads_btn.setToolTip('Show interstates and US routes')
+        self.roads_btn.toggled.connect(self.set_show_roads)
+        self.header.addWidget(self.roads_btn)
+        layout.addLayout(self.header)
+        self.placeholder = QLabel("Loading map…")
+        self.placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.placeholder.setStyleSheet("color: #777; font-size: 14px;")
+        self.stack = QStackedWidget()
+        self.stack.addWidget(self.placeholder)
+        self.map_widget = None
+        layout.addWidget(self.stack)
+        self.setLayout(layout)
+
+        self.selected_events = []
+        self.map_built = False
+        self.build_generation = 0
+        self.build_task = None
+        self.gazetteer = None
+        self.place_events = {}
+
+        event_store.events_added.connect(self.on_events_changed)
+        event_store.events_updated.connect(self.on_events_changed)
+        event_store.events_removed.connect(self.on_events_changed)
+        for signal in (event_store.events_added, event_store.events_updated, event_store.events_removed):
+            signal.connect(self.update_unmatched)
+
+    def set_map_widget(self, widget):
+        """The widget the placeholder gives way to once the first build arrives."""
+        self.map_widget = widget
+        self.stack.addWidget(widget)
+
+    def add_header_button(self, button):
+        """Header buttons sit left of the Roads toggle."""
+        self.header.insertWidget(self.header.indexOf(self.roads_btn), button)
+
+    def highlight_date(self, events):
+        """Update map for selected date (datetime.date)."""
+        self.selected_events = events
+        # Until the first frame exists only the latest selection is kept; show_map applies it
+        if self.map_built:
+            self.redraw_highlights()
+
+    def set_show_roads(self, show):
+        self.show_roads = show
+        set_setting("map/roads", show)
+
+    def request_map(self):
+        """Start a background build; any build still in flight is superseded."""
+        self.build_generation += 1
+        task = self.create_build_task(self.build_generation)
+        task.signals.finished.connect(self.on_map_ready)
+        task.signals.failed.connect(self.on_map_failed)
+        self.build_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def is_current_build(self, generation):
+        return generation == self.build_generation
+
+    def on_map_ready(self, generation, result):
+        if generation != self.build_generation:
+            return
+        self.build_task = None
+        self.show_map(result)
+        self.update_unmatched()
+        self.map_built = True
+        self.stack.setCurrentWidget(self.map_widget)
+        self.map_ready.emit()
+
+    def on_map_failed(self, generation, message):
+        if generation != self.build_generation:
+            return
+        self.build_task = None
+        print(f"Map failed to load: {message}")
+        self.placeholder.setText(f"Map unavailable\n{message}")
+
+    def place_of(self, ev):
+        return self.gazetteer.resolve(ev.city, ev.county)
+
+    def update_unmatched(self, *_args):
+        """Name the event cities that have no place on the map, and so no pin."""
+        if self.gazetteer is None:
+            return
+        missing = sorted({f"{ev.city.strip().title()} ({ev.county.strip().title()} County)"
+                          for ev in self.events if self.place_of(ev) is None})
+        self.unmatched_label.setText(f"{len(missing)} {'city' if len(missing) == 1 else 'cities'} not on the map")
+        self.unmatched_label.setToolTip("Add them to data/city_aliases.json:\n" + "\n".join(missing))
+        self.unmatched_label.setVisible(bool(missing))
@@ -0,0 +1,218 @@
+import calendar
+from datetime import datetime, time
+
+from PyQt6.QtWidgets import QWidget, QToolTip
+from PyQt6.QtCore import Qt, QEvent, QRectF, QPointF, pyqtSignal
+from PyQt6.QtGui import QPainter, QColor, QFont, QFontMetrics
+
+HEADER_H = 20
+DAY_H = 22
+BAR_H = 18
+BAR_GAP = 2
+MORE_H = 14
+BAR_INSET = 2
+BAR_RADIUS = 5
+TODAY_COLOR = QColor("#a8c7fa")
+GRID_COLOR = QColor("#d0d0d0")
+OTHER_MONTH_COLOR = QColor("#aaa")
+MORE_COLOR = QColor("#999")
+
+
+class MonthGridWidget(QWidget):
+    """Whole month drawn in one paintEvent, with multi-day events as continuous bars.
+
+    Geometry for clicks and tooltips is kept in a single hit-test list that is
+    rebuilt only when the layout or the widget size changes.
+    """
+
+    day_clicked = pyqtSignal(object)          # datetime of the clicked day
+    more_clicked = pyqtSignal(object, list)   # datetime, every event on that day
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.month_layout = None
+        self.today = None
+        self._hits = None  # [(QRectF, kind, payload)], most specific first
+        self._fit = None   # (lanes, hidden) for the current cell height
+        days = list(calendar.day_abbr)
+        self._weekdays = days[-1:] + days[:-1]
+        self._bar_font = QFont(self.font())
+        self._bar_font.setPixelSize(11)
+        self._more_font = QFont(self.font())
+        self._more_font.setPixelSize(10)
+        self._more_font.setUnderline(True)
+        self.setMinimumSize(420, 360)
+
+    def set_month_layout(self, month_layout, today):
+        self.month_layout = month_layout
+        self.today = today
+        self._hits = None
+        self._fit = None
+        self.update()
+
+    def resizeEvent(self, event):
+        self._hits = None
+        self._fit = None
+        super().resizeEvent(event)
+
+    # --- geometry ---
+    def _cell_size(self):
+        return self.width() / 7, (self.height() - HEADER_H) / 6
+
+    def _cell_rect(self, i):
+        cw, ch = self._cell_size()
+        return QRectF((i % 7) * cw, HEADER_H + (i // 7) * ch, cw, ch)
+
+    def _day_number_rect(self, i):
+        cell = self._cell_rect(i)
+        return QRectF(cell.center().x() - DAY_H / 2, cell.top() + 1, DAY_H, DAY_H - 2)
+
+    def _bar_rect(self, seg):
+        cw, ch = self._cell_size()
+        left = seg.col_start * cw + (BAR_INSET if seg.starts else 0)
+        right = (seg.col_end + 1) * cw - (BAR_INSET if seg.ends else 0)
+        top = HEADER_H + seg.week * ch + DAY_H + seg.lane * (BAR_H + BAR_GAP)
+        return QRectF(left, top, right - left, BAR_H)
+
+    def _fit_lanes(self):
+        """Lanes that fit in the current row height, and the "+N more" counts that go with them."""
+        if self._fit is None:
+            _, ch = self._cell_size()
+            room = int((ch - DAY_H - MORE_H) // (BAR_H + BAR_GAP))
+            lanes = max(0, min(self.month_layout.max_lanes, room))
+            if lanes == self.month_layout.max_lanes:
+                hidden = self.month_layout.hidden
+            else:
+                hidden = [0] * len(self.month_layout.hidden)
+                for segments in self.month_layout.weeks:
+                    for seg in segments:
+                        if seg.lane >= lanes:
+                            for col in range(seg.col_start, seg.col_end + 1):
+                                hidden[seg.week * 7 + col] += 1
+            self._fit = (lanes, hidden)
+        return self._fit
+
+    def _more_rect(self, i):
+        cell = self._cell_rect(i)
+        lanes, _ = self._fit_lanes()
+        top = cell.top() + DAY_H + lanes * (BAR_H + BAR_GAP)
+        return QRectF(cell.left() + BAR_INSET, top, cell.width() - 2 * BAR_INSET, MORE_H)
+
+    def _visible_segments(self):
+        lanes, _ = self._fit_lanes()
+        for segments in self.month_layout.weeks:
+            for seg in segments:
+                if seg.lane < lanes:
+                    yield seg
+
+    def hits(self):
+        if self._hits is None and self.month_layout is not None:
+            hits = []
+            _, hidden = self._fit_lanes()
+            for i in range(42):
+                hits.append((self._day_number_rect(i), "day", i))
+                if hidden[i]:
+                    hits.append((self._more_rect(i), "more", i))
+            for seg in self._visible_segments():
+                hits.append((self._bar_rect(seg), "event", seg))
+            for i in range(42):
+                hits.append((self._cell_rect(i), "cell", i))
+            self._hits = hits
+        return self._hits or []
+
+    def hit_at(self, pos):
+        for rect, kind, payload in self.hits():
+            if rect.contains(pos):
+                return kind, payload
+        return None, None
+
+    def _day_datetime(self, i):
+        return datetime.combine(self.month_layout.day(i), time())
+
+    # --- painting ---
+    def paintEvent(self, event):
+        if self.month_layout is None:
+            return
+        p = QPainter(self)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        cw, ch = self._cell_size()
+        text_color = self.palette().color(self.foregroundRole())
+
+        p.setPen(text_color)
+        for col, name in enumerate(self._weekdays):
+            p.drawText(QRectF(col * cw, 0, cw, HEADER_H), Qt.AlignmentFlag.AlignCenter, name)
+
+        p.setPen(GRID_COLOR)
+        for row in range(7):
+            y = HEADER_H + row * ch
+            p.drawLine(QPointF(0, y), QPointF(self.width(), y))
+        for col in range(8):
+            p.drawLine(QPointF(col * cw, HEADER_H), QPointF(col * cw, self.height()))
+
+        bold = QFont(self.font())
+        bold.setBold(True)
+        for i in range(42):
+            day = self.month_layout.day(i)
+            rect = self._day_number_rect(i)
+            if day == self.today:
+                p.setPen(Qt.PenStyle.NoPen)
+                p.setBrush(TODAY_COLOR)
+                p.drawEllipse(rect.center(), 10, 10)
+                p.setFont(bold)
+                p.setPen(QColor("black"))
+            else:
+                p.setFont(self.font())
+                p.setPen(text_color if day.month == self.month_layout.month else OTHER_MONTH_COLOR)
+            p.drawText(rect, Qt.AlignmentFlag.AlignCenter, str(day.day))
+
+        p.setFont(self._bar_font)
+        metrics = QFontMetrics(self._bar_font)
+        for seg in self._visible_segments():
+            rect = self._bar_rect(seg)
+            p.setPen(Qt.PenStyle.NoPen)
+            p.setBrush(QColor(*seg.event.chip))
+            p.drawRoundedRect(rect, BAR_RADIUS, BAR_RADIUS)
+            # Square off the ends that continue into the previous/next week
+            if not seg.starts:
+                p.drawRect(QRectF(rect.left(), rect.top(), BAR_RADIUS, rect.height()))
+            if not seg.ends:
+                p.drawRect(QRectF(rect.right() - BAR_RADIUS, rect.top(), BAR_RADIUS, rect.height()))
+            p.setPen(QColor("#fff"))
+            text_rect = rect.adjusted(3, 0, -3, 0)
+            text = metrics.elidedText(seg.event.description, Qt.TextElideMode.ElideRight, int(text_rect.width()))
+            p.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, text)
+
+        p.setFont(self._more_font)
+        p.setPen(MORE_COLOR)
+        _, hidden = self._fit_lanes()
+        for i, count in enumerate(hidden):
+            if count:
+                p.drawText(self._more_rect(i), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                           f"+{count} more")
+        p.end()
+
+    # --- interaction ---
+    def mousePressEvent(self, event):
+        if self.month_layout is None or event.button() != Qt.MouseButton.LeftButton:
+            return super().mousePressEvent(event)
+        kind, payload = self.hit_at(event.position())
+        if kind == "more":
+            self.more_clicked.emit(self._day_datetime(payload), self.month_layout.day_events[payload])
+        elif kind == "event":
+            cw, _ = self._cell_size()
+            col = min(6, int(event.position().x() // cw))
+            self.day_clicked.emit(self._day_datetime(payload.week * 7 + col))
+        elif kind in ("day", "cell"):
+            self.day_clicked.emit(self._day_datetime(payload))
+
+    def event(self, event):
+        if event.type() == QEvent.Type.ToolTip and self.month_layout is not None:
+            kind, payload = self.hit_at(QPointF(event.pos()))
+            if kind == "event":
+                ev = payload.event
+                QToolTip.showText(event.globalPos(), f"{ev.description}\n{ev.date_range_text()}", self)
+            else:
+                QToolTip.hideText()
+                event.ignore()
+            return True
+        return super().event(event)